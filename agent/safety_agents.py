@@ -59,6 +59,8 @@ safety_router_agent = Agent(
     handoffs=[ems_agent, fire_agent, compliance_agent],
 )
 
+_ROUTER_PREFIX = "Analyze this construction site scenario for safety hazards:\n\n"
+
 
 def create_runner(api_key: str = "", verbose: bool = True) -> Runner:
     return Runner(base_url="https://integrate.api.nvidia.com/v1", api_key=api_key, verbose=verbose)
@@ -67,7 +69,22 @@ def create_runner(api_key: str = "", verbose: bool = True) -> Runner:
 def run_agent_system(input: str, runner: Runner, max_handoffs: int = 5) -> str:
     result = runner.run_with_handoffs(
         safety_router_agent,
-        f"Analyze this construction site scenario for safety hazards:\n\n{input}",
+        _ROUTER_PREFIX + input,
         max_handoffs=max_handoffs,
     )
     return result.output
+
+
+def run_agent_system_batch(
+    inputs: list[str], runner: Runner, max_handoffs: int = 5, max_concurrency: int = 16
+) -> list[str]:
+    # Repeated scenarios are analyzed once and the output fanned back out
+    unique_inputs = list(dict.fromkeys(inputs))
+    results = runner.run_batch(
+        safety_router_agent,
+        [_ROUTER_PREFIX + input for input in unique_inputs],
+        max_handoffs=max_handoffs,
+        max_concurrency=max_concurrency,
+    )
+    outputs = {input: result.output for input, result in zip(unique_inputs, results, strict=True)}
+    return [outputs[input] for input in inputs]
@@ -4,6 +4,7 @@ Inspired by OpenAI Agents SDK architecture
 """
 
 from .agent import Agent
+from .cache import LRUResponseCache, RedisBackend
 from .context import Context
 from .exceptions import AgentError, HandoffError, ToolError
 from .logger import AgentLogger
@@ -16,6 +17,8 @@ __all__ = [
     "AgentLogger",
     "Context",
     "HandoffError",
+    "LRUResponseCache",
+    "RedisBackend",
     "Runner",
     "ToolError",
     "tool",
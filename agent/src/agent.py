@@ -1,3 +1,4 @@
+import sys
 from typing import Any, Optional
 
 from .tools import Tool
@@ -8,6 +9,22 @@ class Agent:
     An AI agent with instructions, tools, and handoff capabilities
     """
 
+    __slots__ = (
+        "_api_tools",
+        "_api_tools_with_handoffs",
+        "_handoff_by_lower",
+        "_handoff_tool",
+        "_handoffs",
+        "_tool_map",
+        "_tools",
+        "handoff_description",
+        "instructions",
+        "max_tokens",
+        "model",
+        "name",
+        "temperature",
+    )
+
     def __init__(
         self,
         name: str,
@@ -35,14 +52,49 @@ class Agent:
         self.name = name
         self.instructions = instructions
         self.model = model
-        self.tools = tools or []
-        self.handoffs = handoffs or []
+        self._tools = tools or []
+        self._handoffs = handoffs or []
         self.handoff_description = handoff_description
         self.temperature = temperature
         self.max_tokens = max_tokens
 
-        # Create tool map for quick lookup
-        self._tool_map: dict[str, Tool] = {tool.name: tool for tool in self.tools}
+        self._handoff_tool: Tool | None = self._build_handoff_tool()
+        self._build_lookups()
+
+    @property
+    def tools(self) -> list[Tool]:
+        """Tools available to the agent (reassign rather than mutate to update)"""
+        return self._tools
+
+    @tools.setter
+    def tools(self, tools: list[Tool]):
+        self._tools = tools
+        self._build_lookups()
+
+    @property
+    def handoffs(self) -> list["Agent"]:
+        """Agents this agent can hand off to (reassign rather than mutate to update)"""
+        return self._handoffs
+
+    @handoffs.setter
+    def handoffs(self, handoffs: list["Agent"]):
+        self._handoffs = handoffs
+        self._build_lookups()
+
+    def _build_lookups(self):
+        """Rebuild the tool and handoff lookups used on every model call"""
+        self._tool_map: dict[str, Tool] = {tool.name: tool for tool in self._tools}
+        self._handoff_by_lower: dict[str, Agent] = {
+            agent.name.casefold(): agent for agent in self._handoffs
+        }
+
+        # Tool definitions are sorted by name so the request prefix is byte-identical
+        # across calls, which lets the provider reuse its prompt cache
+        handoff_tools = [agent._handoff_tool for agent in self._handoffs if agent._handoff_tool]
+        self._api_tools: list[dict[str, Any]] = _to_api_format(self._tools)
+        self._api_tools_with_handoffs: list[dict[str, Any]] = _to_api_format(
+            self._tools + handoff_tools
+        )
 
     def get_tool(self, name: str) -> Tool | None:
         """
@@ -54,16 +106,20 @@ class Agent:
         Returns:
             Tool instance or None if not found
         """
-        return self._tool_map.get(name)
+        # Tool names are interned, so an interned lookup key compares by identity
+        return self._tool_map.get(sys.intern(name))
 
-    def get_tools_for_api(self) -> list[dict[str, Any]]:
+    def get_tools_for_api(self, include_handoffs: bool = False) -> list[dict[str, Any]]:
         """
-        Get tools in OpenAI API format
+        Get tools in OpenAI API format, sorted by name
+
+        Args:
+            include_handoffs: Also include the handoff tool of each handoff agent
 
         Returns:
-            List of tool definitions
+            List of tool definitions (shared, do not mutate)
         """
-        return [tool.to_openai_format() for tool in self.tools]
+        return self._api_tools_with_handoffs if include_handoffs else self._api_tools
 
     def has_tools(self) -> bool:
         """Check if agent has any tools"""
@@ -83,27 +139,25 @@ class Agent:
         Returns:
             Agent instance or None if not found
         """
-        name_lower = name.lower()
-        for agent in self.handoffs:
-            if agent.name.lower() == name_lower:
-                return agent
-        return None
+        return self._handoff_by_lower.get(name.casefold())
 
     def create_handoff_tool(self) -> Tool | None:
         """
-        Create a special tool for handing off to this agent
+        Get the special tool for handing off to this agent
 
         Returns:
             Handoff tool or None if no handoff description
         """
+        return self._handoff_tool
+
+    def _build_handoff_tool(self) -> Tool | None:
+        """Build the handoff tool once at construction"""
         if not self.handoff_description:
             return None
 
         def handoff_func(reason: str = "") -> str:
             return f"Handing off to {self.name}: {reason}"
 
-        from .tools import Tool
-
         return Tool(
             name=f"handoff_to_{self.name.lower().replace(' ', '_')}",
             function=handoff_func,
@@ -119,3 +173,7 @@ class Agent:
 
     def __repr__(self):
         return f"Agent(name='{self.name}', tools={len(self.tools)}, handoffs={len(self.handoffs)})"
+
+
+def _to_api_format(tools: list[Tool]) -> list[dict[str, Any]]:
+    return [tool.to_openai_format() for tool in sorted(tools, key=lambda tool: tool.name)]
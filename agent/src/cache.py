@@ -0,0 +1,128 @@
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Protocol
+
+from . import serialization
+from .agent import Agent
+
+
+class CacheBackend(Protocol):
+    """Storage interface for cached agent responses"""
+
+    def get(self, key: str) -> dict[str, Any] | None: ...
+
+    def set(self, key: str, value: dict[str, Any]) -> None: ...
+
+
+class LRUResponseCache:
+    """
+    In-process LRU cache with per-entry TTL
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float | None = 3600.0):
+        """
+        Initialize the cache
+
+        Args:
+            maxsize: Maximum number of entries kept
+            ttl: Seconds an entry stays valid (None for no expiry)
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            stored_at, value = entry
+            if self.ttl is not None and time.monotonic() - stored_at > self.ttl:
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: dict[str, Any]) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drop all entries"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __repr__(self):
+        return f"LRUResponseCache(entries={len(self._entries)}, maxsize={self.maxsize})"
+
+
+class RedisBackend:
+    """
+    Redis-backed response cache shared across processes
+    """
+
+    def __init__(
+        self,
+        client: Any = None,
+        url: str = "redis://localhost:6379/0",
+        ttl: int | None = 3600,
+        prefix: str = "omniguard:response:",
+    ):
+        """
+        Initialize the backend
+
+        Args:
+            client: Existing redis client (creates one from url if not provided)
+            url: Redis connection URL
+            ttl: Seconds an entry stays valid (None for no expiry)
+            prefix: Key namespace
+        """
+        if client is None:
+            import redis
+
+            client = redis.Redis.from_url(url)
+
+        self.client = client
+        self.ttl = ttl
+        self.prefix = prefix
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        raw = self.client.get(self.prefix + key)
+        return serialization.loads(raw) if raw is not None else None
+
+    def set(self, key: str, value: dict[str, Any]) -> None:
+        self.client.set(self.prefix + key, serialization.dumps_bytes(value), ex=self.ttl)
+
+
+def make_cache_key(agent: Agent, prompt: str) -> str:
+    """
+    Build a cache key from everything that determines an agent's response
+
+    Args:
+        agent: Entry agent
+        prompt: User input
+
+    Returns:
+        Hex digest identifying the request
+    """
+    payload = {
+        "model": agent.model,
+        "instructions": agent.instructions,
+        "tools": sorted(tool.name for tool in agent.tools),
+        "handoffs": sorted(handoff.name for handoff in agent.handoffs),
+        "temperature": agent.temperature,
+        "prompt": prompt,
+    }
+    return hashlib.blake2b(json.dumps(payload, sort_keys=True).encode()).hexdigest()
@@ -1,3 +1,4 @@
+from collections.abc import Sequence
 from typing import Any
 
 from .types import Message
@@ -8,15 +9,19 @@ class Context:
     Manages conversation context and history across agent runs
     """
 
-    def __init__(self, initial_messages: list[Message] | None = None):
+    __slots__ = ("_dicts", "messages", "metadata")
+
+    def __init__(self, initial_messages: Sequence[Message] | None = None):
         """
         Initialize context with optional message history
 
         Args:
-            initial_messages: Initial conversation history
+            initial_messages: Initial conversation history (copied)
         """
-        self.messages: list[Message] = initial_messages or []
+        self.messages: list[Message] = list(initial_messages or ())
         self.metadata: dict[str, Any] = {}
+        # API dicts for messages[:len(_dicts)], extended lazily by get_messages_as_dict
+        self._dicts: list[dict[str, Any]] = []
 
     def add_message(self, role: str, content: str | None = None, **kwargs):
         """
@@ -52,38 +57,35 @@ class Context:
         Convert messages to dictionary format for API calls
 
         Returns:
-            List of message dictionaries
+            List of message dictionaries (shared, do not mutate)
         """
-        result = []
-        for msg in self.messages:
-            msg_dict = {"role": msg.role}
-
-            if msg.content:
-                msg_dict["content"] = msg.content
-
-            if msg.name:
-                msg_dict["name"] = msg.name
-
-            if msg.tool_calls:
-                msg_dict["tool_calls"] = msg.tool_calls
+        # Only convert messages appended since the last call
+        for msg in self.messages[len(self._dicts) :]:
+            self._dicts.append(msg.to_dict())
 
-            if msg.tool_call_id:
-                msg_dict["tool_call_id"] = msg.tool_call_id
+        return self._dicts
 
-            result.append(msg_dict)
+    def snapshot(self) -> tuple[Message, ...]:
+        """
+        Get an immutable view of the conversation so far
 
-        return result
+        Returns:
+            Messages in order
+        """
+        return tuple(self.messages)
 
     def clear(self):
         """Clear all messages from context"""
         self.messages = []
         self.metadata = {}
+        self._dicts = []
 
     def clone(self) -> "Context":
         """Create a copy of this context"""
         new_context = Context()
         new_context.messages = self.messages.copy()
         new_context.metadata = self.metadata.copy()
+        new_context._dicts = self._dicts.copy()
         return new_context
 
     def __len__(self):
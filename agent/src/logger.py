@@ -1,9 +1,16 @@
+import atexit
+import queue
+import sys
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolCallTrace:
     """Trace information for a tool call"""
 
@@ -16,12 +23,13 @@ class ToolCallTrace:
     error: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentTrace:
     """Trace information for an agent execution"""
 
     agent_name: str
     start_time: str
+    start_ns: int = field(default=0, repr=False)  # perf_counter_ns() at start, for durations
     end_time: str | None = None
     duration_ms: float | None = None
     tool_calls: list[ToolCallTrace] = field(default_factory=list)
@@ -29,23 +37,112 @@ class AgentTrace:
     handoff_to: str | None = None
     final_output: str | None = None
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "AgentTrace":
+        """Rebuild a trace from its asdict() form"""
+        tool_calls = [ToolCallTrace(**tc) for tc in data.get("tool_calls", [])]
+        return cls(**{**data, "tool_calls": tool_calls})
+
+
+class _ConsoleWriter:
+    """
+    Background thread that batches log lines into single stdout writes
+
+    Shared by every AgentLogger so concurrent runs never contend on print().
+    """
+
+    def __init__(self, flush_interval: float = 0.05, max_batch: int = 256):
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        self._queue: queue.SimpleQueue[str | threading.Event] = queue.SimpleQueue()
+        self._thread: threading.Thread | None = None
+        self._start_lock = threading.Lock()
+
+    def write(self, line: str):
+        """Queue a line for output"""
+        if self._thread is None:
+            self._start()
+        self._queue.put(line)
+
+    def flush(self, timeout: float = 1.0):
+        """Block until every line queued so far has been written"""
+        if self._thread is None:
+            return
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait(timeout)
+
+    def _start(self):
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._drain, name="agent-logger", daemon=True
+                )
+                self._thread.start()
+
+    def _drain(self):
+        while True:
+            lines: list[str] = []
+            waiters: list[threading.Event] = []
+
+            # Block for the first item, then coalesce whatever arrives within the interval
+            item = self._queue.get()
+            deadline = time.monotonic() + self.flush_interval
+            while True:
+                if isinstance(item, threading.Event):
+                    waiters.append(item)
+                    break
+                lines.append(item)
+                remaining = deadline - time.monotonic()
+                if len(lines) >= self.max_batch or remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+
+            if lines:
+                sys.stdout.write("\n".join(lines) + "\n")
+                sys.stdout.flush()
+            for waiter in waiters:
+                waiter.set()
+
+
+_console = _ConsoleWriter()
+atexit.register(_console.flush)
+
 
 class AgentLogger:
     """
     Logger for tracking agent execution, tool calls, and handoffs
     """
 
-    def __init__(self, verbose: bool = True):
+    def __init__(
+        self,
+        verbose: bool = True,
+        max_traces: int | None = 1024,
+        max_field_chars: int | None = 512,
+        on_trace: Callable[[AgentTrace], None] | None = None,
+    ):
         """
         Initialize the logger
 
         Args:
             verbose: Whether to print logs to console
+            max_traces: Number of most recent agent traces kept (None for unbounded)
+            max_field_chars: Longest tool result/argument string stored in a trace
+                (None to store in full; console output is unaffected)
+            on_trace: Called with each agent trace as it is recorded
         """
         self.verbose = verbose
-        self.traces: list[AgentTrace] = []
+        self.max_traces = max_traces
+        self.max_field_chars = max_field_chars
+        self.on_trace = on_trace
+        self.traces: deque[AgentTrace] = deque(maxlen=max_traces)
+        self.trace_count = 0  # Traces ever recorded, including evicted ones
         self.current_trace: AgentTrace | None = None
         self._indent_level = 0
+        self._stream_buffer = ""
 
     def start_agent(self, agent_name: str):
         """
@@ -57,6 +154,7 @@ class AgentLogger:
         self.current_trace = AgentTrace(
             agent_name=agent_name,
             start_time=datetime.now().isoformat(),
+            start_ns=time.perf_counter_ns(),
         )
         self._log_box(f"AGENT: {agent_name}", "START")
 
@@ -69,11 +167,9 @@ class AgentLogger:
             handoff_to: Name of agent to hand off to (if any)
         """
         if self.current_trace:
-            end_time = datetime.now()
-            start_time = datetime.fromisoformat(self.current_trace.start_time)
-            duration_ms = (end_time - start_time).total_seconds() * 1000
+            duration_ms = (time.perf_counter_ns() - self.current_trace.start_ns) / 1e6
 
-            self.current_trace.end_time = end_time.isoformat()
+            self.current_trace.end_time = datetime.now().isoformat()
             self.current_trace.duration_ms = duration_ms
             self.current_trace.final_output = output
             self.current_trace.handoff_to = handoff_to
@@ -83,9 +179,37 @@ class AgentLogger:
             else:
                 self._log_box(f"COMPLETED ({duration_ms:.0f}ms)", "END")
 
-            self.traces.append(self.current_trace)
+            self.add_traces((self.current_trace,))
             self.current_trace = None
 
+    def add_traces(self, traces: Iterable[AgentTrace]):
+        """
+        Record finished agent traces, evicting the oldest beyond max_traces
+
+        Args:
+            traces: Traces to append
+        """
+        for trace in traces:
+            self.traces.append(trace)
+            self.trace_count += 1
+            if self.on_trace is not None:
+                self.on_trace(trace)
+
+    def traces_since(self, mark: int) -> list[AgentTrace]:
+        """
+        Get the traces recorded after a trace_count mark (those still retained)
+
+        Args:
+            mark: Value of trace_count taken earlier
+
+        Returns:
+            Traces in recording order
+        """
+        new = min(self.trace_count - mark, len(self.traces))
+        if new <= 0:
+            return []
+        return list(self.traces)[-new:]
+
     def log_tool_call(
         self,
         tool_name: str,
@@ -106,10 +230,11 @@ class AgentLogger:
             success: Whether the tool call succeeded
             error: Error message if failed
         """
+        limit = self.max_field_chars
         trace = ToolCallTrace(
             tool_name=tool_name,
-            arguments=arguments,
-            result=result,
+            arguments={k: _truncate(v, limit) for k, v in arguments.items()},
+            result=_truncate(result, limit),
             duration_ms=duration_ms,
             timestamp=datetime.now().isoformat(),
             success=success,
@@ -133,6 +258,15 @@ class AgentLogger:
         else:
             self._log_error(f"Tool {tool_name} failed: {error}")
 
+    def log_tool_reuse(self, tool_name: str):
+        """
+        Log a tool call answered with the result of an identical call in the same response
+
+        Args:
+            tool_name: Name of the tool
+        """
+        self._log_simple(f"│  ├─ Tool: {tool_name} (identical call, result reused)")
+
     def log_iteration(self, iteration: int):
         """
         Log an agent loop iteration
@@ -156,6 +290,26 @@ class AgentLogger:
         model_short = model.split("/")[-1] if "/" in model else model
         self._log_simple(f"│  ├─ Model: {model_short} ({message_count} msgs)")
 
+    def log_model_delta(self, text: str):
+        """
+        Log streamed model output as it arrives, one console line per completed line
+
+        Args:
+            text: Content delta from the model
+        """
+        if not self.verbose:
+            return
+
+        *lines, self._stream_buffer = (self._stream_buffer + text).split("\n")
+        for line in lines:
+            _console.write(f"│  │  {line}")
+
+    def end_model_stream(self):
+        """Log any streamed output still waiting for a line break"""
+        if self._stream_buffer:
+            self._log_simple(f"│  │  {self._stream_buffer}")
+            self._stream_buffer = ""
+
     def log_handoff_attempt(self, from_agent: str, to_agent: str, reason: str = ""):
         """
         Log a handoff attempt
@@ -174,6 +328,9 @@ class AgentLogger:
         Returns:
             Formatted summary string
         """
+        if self.verbose:
+            self.flush()
+
         lines = []
         lines.append("\n" + "=" * 80)
         lines.append("EXECUTION SUMMARY")
@@ -203,14 +360,14 @@ class AgentLogger:
             return
 
         if box_type == "START":
-            print(f"\n┌─ {message}")
+            _console.write(f"\n┌─ {message}")
         elif box_type == "END" or box_type == "TRANSFER":
-            print(f"└─ {message}\n")
+            _console.write(f"└─ {message}\n")
 
     def _log_simple(self, message: str):
         """Log simple line"""
         if self.verbose:
-            print(message)
+            _console.write(message)
 
     def _log_tool(self, tool_name: str, args: str, result: str, duration_ms: float):
         """Log tool call with clean formatting"""
@@ -221,15 +378,21 @@ class AgentLogger:
         if len(result) > 80:
             result_preview += "..."
 
-        print(f"│  ├─ Tool: {tool_name}")
-        print(f"│  │  ├─ Args: {args}")
-        print(f"│  │  ├─ Result: {result_preview}")
-        print(f"│  │  └─ Time: {duration_ms:.1f}ms")
+        _console.write(
+            f"│  ├─ Tool: {tool_name}\n"
+            f"│  │  ├─ Args: {args}\n"
+            f"│  │  ├─ Result: {result_preview}\n"
+            f"│  │  └─ Time: {duration_ms:.1f}ms"
+        )
 
     def _log_error(self, message: str):
         """Log error message"""
         if self.verbose:
-            print(f"│  └─ ERROR: {message}")
+            _console.write(f"│  └─ ERROR: {message}")
+
+    def flush(self):
+        """Block until queued console output has been written"""
+        _console.flush()
 
     def indent(self):
         """Increase indentation level"""
@@ -241,6 +404,13 @@ class AgentLogger:
 
     def clear(self):
         """Clear all traces"""
-        self.traces = []
+        self.traces = deque(maxlen=self.max_traces)
         self.current_trace = None
         self._indent_level = 0
+
+
+def _truncate(value: Any, limit: int | None) -> Any:
+    """Shorten long strings stored in traces"""
+    if limit is None or not isinstance(value, str) or len(value) <= limit:
+        return value
+    return value[: limit - 3] + "..."
@@ -1,16 +1,48 @@
-import json
+import asyncio
+import contextlib
+import functools
+import importlib.util
 import os
+import sys
 import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
+from typing import Any
 
-from openai import OpenAI
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient, DefaultHttpxClient, OpenAI
+from openai.types.chat import ChatCompletionMessage
 
+from . import serialization
 from .agent import Agent
+from .cache import CacheBackend, make_cache_key
 from .context import Context
 from .exceptions import AgentError, HandoffError
-from .logger import AgentLogger
-from .tools import execute_tool_call
+from .logger import AgentLogger, AgentTrace
+from .rate_limiter import TokenBucket
+from .streaming import acollect_stream, collect_stream
+from .tools import Tool, execute_tool_call, parse_arguments
 from .types import AgentResult
 
+# HTTP/2 multiplexes concurrent requests over one connection; needs the optional h2 package
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64)
+_HTTP_TIMEOUT = httpx.Timeout(60.0, connect=10.0)
+
+# Fields echoed back to the API; providers may attach extras (e.g. stream indices)
+_TOOL_CALL_FIELDS = frozenset({"id", "type", "function"})
+
+_BATCH_ENDPOINT = "/v1/chat/completions"
+_BATCH_FINAL_STATUSES = frozenset({"completed", "failed", "expired", "cancelled"})
+
+# Shared by all runners so concurrent tool calls don't spawn threads every iteration
+_TOOL_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="agent-tool")
+
+# Close tasks scheduled by Runner.close inside a running loop, kept until they finish
+_PENDING_CLOSES: set[asyncio.Task] = set()
+
 
 class Runner:
     """
@@ -23,30 +55,68 @@ class Runner:
         base_url: str = "https://integrate.api.nvidia.com/v1",
         api_key: str = "",
         verbose: bool = True,
+        requests_per_minute: int | None = None,
+        cache: CacheBackend | None = None,
+        semantic_cache_threshold: float | None = None,
+        stream: bool = True,
+        async_client: AsyncOpenAI | None = None,
+        prompt_cache_key: bool = False,
     ):
         """
         Initialize the runner
 
         Args:
-            client: OpenAI client (creates one if not provided)
+            client: OpenAI client (defaults to a pooled client shared per base_url and key)
             base_url: API base URL
             api_key: API key (defaults to NVIDIA_API_KEY env var)
             verbose: Enable verbose logging
+            requests_per_minute: Optional cap on model calls per minute (avoids 429s)
+            cache: Optional response cache consulted by run_with_handoffs
+            semantic_cache_threshold: Enable the semantic cache with this cosine threshold
+                (disabled by default; paraphrase hits skip the model entirely)
+            stream: Stream completions, stopping generation early once a handoff is emitted
+            async_client: AsyncOpenAI client used by arun (created on the first async call
+                if no client is provided; otherwise arun calls the sync client on a thread)
+            prompt_cache_key: Send a per-agent prompt_cache_key so the provider routes an
+                agent's requests to the same prompt cache (OpenAI-compatible endpoints only)
+
+        Raises:
+            ValueError: If no client is given and no API key is available
         """
+        self._owns_aclient = client is None and async_client is None
         if client is None:
+            api_key = api_key or os.getenv("NVIDIA_API_KEY")
             if not api_key:
-                api_key = os.getenv(
-                    "NVIDIA_API_KEY",
-                    "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",
-                )
-            self.client = OpenAI(base_url=base_url, api_key=api_key)
+                raise ValueError("No API key provided and NVIDIA_API_KEY is not set")
+            self.client = _get_client(base_url, api_key)
         else:
             self.client = client
 
+        # The async client opens its own connection pool, so it is only created when needed
+        self._aclient = async_client
+        self._aclient_factory: Callable[[], AsyncOpenAI | None] | None = None
+        if self._owns_aclient:
+            self._aclient_factory = functools.partial(_new_async_client, base_url, api_key)
+
         self.max_iterations = 10  # Prevent infinite loops
+        self.stream = stream
+        self.prompt_cache_key = prompt_cache_key
         self.logger = AgentLogger(verbose=verbose)
+        self.rate_limiter = TokenBucket(requests_per_minute) if requests_per_minute else None
+        self.cache = cache
+        self.semantic_cache = None
+        if semantic_cache_threshold is not None:
+            from .semantic_cache import SemanticCache
+
+            self.semantic_cache = SemanticCache(threshold=semantic_cache_threshold)
 
-    def run(self, agent: Agent, user_input: str, context: Context | None = None) -> AgentResult:
+    def run(
+        self,
+        agent: Agent,
+        user_input: str,
+        context: Context | None = None,
+        handoffs: bool = False,
+    ) -> AgentResult:
         """
         Run an agent with user input
 
@@ -54,6 +124,7 @@ class Runner:
             agent: Agent to run
             user_input: User message
             context: Conversation context (creates new if not provided)
+            handoffs: Expose the agent's handoff tools alongside its regular tools
 
         Returns:
             AgentResult with final output
@@ -61,6 +132,134 @@ class Runner:
         Raises:
             AgentError: If agent execution fails
         """
+        context = self._start_run(agent, user_input, context)
+        return self._run_loop(agent, context, handoffs)
+
+    def _run_loop(
+        self, agent: Agent, context: Context, handoffs: bool, response: Any = None
+    ) -> AgentResult:
+        """
+        Run the agent loop on a started context
+
+        Args:
+            agent: Agent to run
+            context: Context with the system and user messages added
+            handoffs: Expose the agent's handoff tools alongside its regular tools
+            response: Model response already obtained for the first iteration, if any
+
+        Returns:
+            AgentResult with final output
+        """
+        # Tool calls of the previous iteration; repeating them means the agent is stuck
+        previous_signature: frozenset[tuple[str, str]] = frozenset()
+
+        # Run agent loop
+        for iteration in range(1, self.max_iterations + 1):
+            self.logger.log_iteration(iteration)
+
+            # Call the model
+            if response is None:
+                response = self._call_model(agent, context, handoffs)
+
+            # No tool calls - this is the final response
+            if not response.tool_calls:
+                return self._finish_run(agent, context, response)
+
+            # Execute tools concurrently, then continue loop to get next response
+            pending, handoff_call = self._record_tool_calls(context, response)
+            signature = _tool_call_signature(pending)
+            if handoff_call is None and signature <= previous_signature:
+                self._raise_no_progress(agent)
+            previous_signature = signature
+
+            unique, positions = _dedupe_tool_calls(pending)
+            results = self._execute_tools(unique, agent._tool_map)
+            result = self._apply_tool_results(
+                agent, context, pending, [results[i] for i in positions], handoff_call
+            )
+            if result is not None:
+                return result
+            response = None
+
+        # Max iterations reached
+        self.logger.end_agent("Max iterations exceeded")
+        raise AgentError(
+            f"Agent '{agent.name}' exceeded maximum iterations ({self.max_iterations})"
+        )
+
+    async def arun(
+        self,
+        agent: Agent,
+        user_input: str,
+        context: Context | None = None,
+        handoffs: bool = False,
+    ) -> AgentResult:
+        """
+        Async variant of run
+
+        Model calls go through the async client, so runs can be fanned out with
+        asyncio.gather. The logger tracks one agent at a time, so give each concurrent
+        run its own Runner (they can share clients).
+
+        Args:
+            agent: Agent to run
+            user_input: User message
+            context: Conversation context (creates new if not provided)
+            handoffs: Expose the agent's handoff tools alongside its regular tools
+
+        Returns:
+            AgentResult with final output
+
+        Raises:
+            AgentError: If agent execution fails
+        """
+        context = self._start_run(agent, user_input, context)
+        loop = asyncio.get_running_loop()
+        previous_signature: frozenset[tuple[str, str]] = frozenset()
+
+        for iteration in range(1, self.max_iterations + 1):
+            self.logger.log_iteration(iteration)
+
+            response = await self._acall_model(agent, context, handoffs)
+
+            if not response.tool_calls:
+                return self._finish_run(agent, context, response)
+
+            pending, handoff_call = self._record_tool_calls(context, response)
+            signature = _tool_call_signature(pending)
+            if handoff_call is None and signature <= previous_signature:
+                self._raise_no_progress(agent)
+            previous_signature = signature
+
+            unique, positions = _dedupe_tool_calls(pending)
+            results = await asyncio.gather(
+                *(
+                    loop.run_in_executor(
+                        _TOOL_EXECUTOR, self._execute_tool, tool_call, agent._tool_map
+                    )
+                    for tool_call in unique
+                )
+            )
+            result = self._apply_tool_results(
+                agent, context, pending, [results[i] for i in positions], handoff_call
+            )
+            if result is not None:
+                return result
+
+        self.logger.end_agent("Max iterations exceeded")
+        raise AgentError(
+            f"Agent '{agent.name}' exceeded maximum iterations ({self.max_iterations})"
+        )
+
+    def _raise_no_progress(self, agent: Agent):
+        """End the agent trace and fail a run that repeats its previous tool calls"""
+        self.logger.end_agent("No progress")
+        raise AgentError(
+            f"Agent '{agent.name}' made no progress (repeated its previous tool calls)"
+        )
+
+    def _start_run(self, agent: Agent, user_input: str, context: Context | None) -> Context:
+        """Start the agent trace and build the context for a run"""
         # Start logging
         self.logger.start_agent(agent.name)
 
@@ -73,132 +272,181 @@ class Runner:
 
         # Add user input
         context.add_user_message(user_input)
+        return context
 
-        # Run agent loop
-        iteration = 0
-        while iteration < self.max_iterations:
-            iteration += 1
-            self.logger.log_iteration(iteration)
+    def _finish_run(self, agent: Agent, context: Context, response: Any) -> AgentResult:
+        """Record the model's final answer and end the agent trace"""
+        output = response.content or ""
+        context.add_assistant_message(output)
 
-            # Call the model
-            response = self._call_model(agent, context)
-
-            # Check if response has tool calls
-            tool_calls = response.tool_calls
-
-            if tool_calls:
-                # Add assistant message with tool calls
-                context.add_assistant_message(
-                    content=response.content or "",
-                    tool_calls=[
-                        {
-                            "id": tc.id,
-                            "type": "function",
-                            "function": {
-                                "name": tc.function.name,
-                                "arguments": tc.function.arguments,
-                            },
-                        }
-                        for tc in tool_calls
-                    ],
-                )
+        # Log completion
+        self.logger.end_agent(output)
 
-                # Execute tools
-                handoff_detected = False
-                for tool_call in tool_calls:
-                    tool_name = tool_call.function.name
-
-                    # Check if this is a handoff tool
-                    if tool_name.startswith("handoff_to_"):
-                        handoff_detected = True
-                        target_agent_name = (
-                            tool_name.replace("handoff_to_", "").replace("_", " ").title()
-                        )
-                        target_agent = agent.get_handoff_agent(target_agent_name)
-
-                        if target_agent:
-                            # Log handoff
-                            self.logger.log_handoff_attempt(agent.name, target_agent_name)
-                            self.logger.end_agent(
-                                f"Handing off to {target_agent_name}", handoff_to=target_agent_name
-                            )
-
-                            # Return result indicating handoff
-                            return AgentResult(
-                                output=f"Handing off to {target_agent_name}",
-                                agent_name=agent.name,
-                                messages=context.messages,
-                                handoff_to=target_agent_name,
-                            )
-                        else:
-                            raise HandoffError(f"Handoff agent '{target_agent_name}' not found")
-
-                    # Regular tool execution
-                    tool = agent.get_tool(tool_name)
-                    if tool:
-                        # Parse arguments
-                        try:
-                            arguments = json.loads(tool_call.function.arguments)
-                        except json.JSONDecodeError:
-                            arguments = {}
-
-                        # Execute tool with timing
-                        start_time = time.time()
-                        result = execute_tool_call(tool, tool_call)
-                        duration_ms = (time.time() - start_time) * 1000
-
-                        # Log tool call
-                        self.logger.log_tool_call(
-                            tool_name=tool_name,
-                            arguments=arguments,
-                            result=result,
-                            duration_ms=duration_ms,
-                            success=not result.startswith("Error"),
-                        )
-
-                        context.add_tool_message(
-                            tool_call_id=tool_call.id, name=tool_name, content=result
-                        )
-                    else:
-                        # Tool not found
-                        error_msg = f"Error: Tool '{tool_name}' not found"
-                        self.logger.log_tool_call(
-                            tool_name=tool_name,
-                            arguments={},
-                            result=error_msg,
-                            duration_ms=0,
-                            success=False,
-                            error=error_msg,
-                        )
-                        context.add_tool_message(
-                            tool_call_id=tool_call.id, name=tool_name, content=error_msg
-                        )
-
-                if handoff_detected:
-                    # Already returned above
-                    pass
-
-                # Continue loop to get next response
-                continue
+        return AgentResult(output=output, agent_name=agent.name, messages=context.snapshot())
+
+    def _record_tool_calls(self, context: Context, response: Any) -> tuple[list[Any], Any]:
+        """
+        Add the assistant's tool calls to the context and pick out the ones to execute
+
+        Args:
+            context: Current context
+            response: Model response with tool calls
+
+        Returns:
+            (tool calls to execute, handoff tool call or None)
+        """
+        tool_calls = response.tool_calls
 
+        # Add assistant message with tool calls
+        context.add_assistant_message(
+            content=response.content or "",
+            tool_calls=[tc.model_dump(include=_TOOL_CALL_FIELDS) for tc in tool_calls],
+        )
+
+        # A handoff ends this agent's turn, so only the calls before it are executed
+        pending = []
+        for tool_call in tool_calls:
+            if tool_call.function.name.startswith("handoff_to_"):
+                return pending, tool_call
+            pending.append(tool_call)
+        return pending, None
+
+    def _apply_tool_results(
+        self,
+        agent: Agent,
+        context: Context,
+        tool_calls: list[Any],
+        results: list[tuple[dict[str, Any], str, float]],
+        handoff_call: Any,
+    ) -> AgentResult | None:
+        """
+        Log tool results and add them to the context in the original call order
+
+        Args:
+            agent: Agent being run
+            context: Current context
+            tool_calls: Executed tool calls
+            results: (arguments, result, duration_ms) per tool call; identical calls share
+                one result object
+            handoff_call: Handoff tool call following them, if any
+
+        Returns:
+            Handoff result, or None to continue the agent loop
+
+        Raises:
+            HandoffError: If the handoff target is not one of the agent's handoffs
+        """
+        tool_map = agent._tool_map
+        logged: set[int] = set()
+        for tool_call, outcome in zip(tool_calls, results, strict=True):
+            arguments, result, duration_ms = outcome
+            tool_name = tool_call.function.name
+
+            # Repeats of an identical call still need their own tool message
+            if id(outcome) in logged:
+                self.logger.log_tool_reuse(tool_name)
+            elif tool_name in tool_map:
+                self.logger.log_tool_call(
+                    tool_name=tool_name,
+                    arguments=arguments,
+                    result=result,
+                    duration_ms=duration_ms,
+                    success=not result.startswith("Error"),
+                )
             else:
-                # No tool calls - this is the final response
-                output = response.content or ""
-                context.add_assistant_message(output)
+                self.logger.log_tool_call(
+                    tool_name=tool_name,
+                    arguments={},
+                    result=result,
+                    duration_ms=0,
+                    success=False,
+                    error=result,
+                )
+            logged.add(id(outcome))
 
-                # Log completion
-                self.logger.end_agent(output)
+            context.add_tool_message(tool_call_id=tool_call.id, name=tool_name, content=result)
 
-                return AgentResult(output=output, agent_name=agent.name, messages=context.messages)
+        if handoff_call is None:
+            return None
 
-        # Max iterations reached
-        self.logger.end_agent("Max iterations exceeded")
-        raise AgentError(
-            f"Agent '{agent.name}' exceeded maximum iterations ({self.max_iterations})"
+        tool_name = handoff_call.function.name
+        target_agent_name = tool_name.replace("handoff_to_", "").replace("_", " ").title()
+        target_agent = agent.get_handoff_agent(target_agent_name)
+
+        if not target_agent:
+            raise HandoffError(f"Handoff agent '{target_agent_name}' not found")
+
+        # Answer the handoff call so the history stays valid for the agent that takes over
+        context.add_tool_message(
+            tool_call_id=handoff_call.id,
+            name=tool_name,
+            content=f"Handing off to {target_agent_name}",
         )
 
+        # Log handoff
+        self.logger.log_handoff_attempt(agent.name, target_agent_name)
+        self.logger.end_agent(f"Handing off to {target_agent_name}", handoff_to=target_agent_name)
+
+        # Return result indicating handoff
+        return AgentResult(
+            output=f"Handing off to {target_agent_name}",
+            agent_name=agent.name,
+            messages=context.snapshot(),
+            handoff_to=target_agent_name,
+        )
+
+    def _execute_tools(
+        self, tool_calls: list[Any], tool_map: dict[str, Tool]
+    ) -> list[tuple[dict[str, Any], str, float]]:
+        """
+        Execute independent tool calls concurrently
+
+        Args:
+            tool_calls: Tool calls from one model response
+            tool_map: Tools available to the agent, by name
+
+        Returns:
+            (arguments, result, duration_ms) per tool call, in call order
+        """
+        if len(tool_calls) <= 1:
+            return [self._execute_tool(tool_call, tool_map) for tool_call in tool_calls]
+
+        futures = [
+            _TOOL_EXECUTOR.submit(self._execute_tool, tool_call, tool_map)
+            for tool_call in tool_calls
+        ]
+        return [future.result() for future in futures]
+
+    def _execute_tool(
+        self, tool_call: Any, tool_map: dict[str, Tool]
+    ) -> tuple[dict[str, Any], str, float]:
+        """Execute a single tool call, timing it"""
+        tool_name = sys.intern(tool_call.function.name)
+        tool = tool_map.get(tool_name)
+        if tool is None:
+            return {}, f"Error: Tool '{tool_name}' not found", 0.0
+
+        # Parse arguments once; the same dict is logged and passed to the tool
+        try:
+            arguments = parse_arguments(tool_call.function.arguments)
+        except ValueError as e:
+            return {}, f"Error: {e!s}", 0.0
+
+        # Execute tool with timing
+        start_ns = time.perf_counter_ns()
+        result = execute_tool_call(tool, arguments)
+        duration_ms = (time.perf_counter_ns() - start_ns) / 1e6
+
+        return arguments, result, duration_ms
+
     def run_with_handoffs(
-        self, agent: Agent, user_input: str, context: Context | None = None, max_handoffs: int = 5
+        self,
+        agent: Agent,
+        user_input: str,
+        context: Context | None = None,
+        max_handoffs: int = 5,
+        no_cache: bool = False,
+        force_cache: bool = False,
     ) -> AgentResult:
         """
         Run an agent with automatic handoff support
@@ -208,69 +456,467 @@ class Runner:
             user_input: User message
             context: Conversation context
             max_handoffs: Maximum number of handoffs allowed
+            no_cache: Bypass the response cache for this call
+            force_cache: Cache even when the agent samples with temperature > 0
 
         Returns:
             AgentResult with final output
         """
+        # Only fresh conversations are cacheable
+        use_cache = not no_cache and context is None
+        cached, cache_key, embedding = self._lookup_cached(
+            agent, user_input, use_cache, force_cache
+        )
+        if cached is not None:
+            return cached
+
+        first_trace = self.logger.trace_count
+        result = self._run_handoff_chain(agent, user_input, context, max_handoffs)
+
+        # Keep console output ordered with whatever the caller prints next
+        if self.logger.verbose:
+            self.logger.flush()
+
+        if cache_key is not None or embedding is not None:
+            self._store_cached(agent, result, first_trace, cache_key, embedding)
+
+        return result
+
+    async def arun_with_handoffs(
+        self,
+        agent: Agent,
+        user_input: str,
+        context: Context | None = None,
+        max_handoffs: int = 5,
+        no_cache: bool = False,
+        force_cache: bool = False,
+    ) -> AgentResult:
+        """
+        Async variant of run_with_handoffs
+
+        Agents run through arun. Cache lookups and stores may block (Redis, the
+        embedding model), so they run on a worker thread.
+
+        Args:
+            agent: Initial agent to run
+            user_input: User message
+            context: Conversation context
+            max_handoffs: Maximum number of handoffs allowed
+            no_cache: Bypass the response cache for this call
+            force_cache: Cache even when the agent samples with temperature > 0
+
+        Returns:
+            AgentResult with final output
+        """
+        use_cache = (
+            not no_cache
+            and context is None
+            and (self.cache is not None or self.semantic_cache is not None)
+        )
+        cache_key = embedding = None
+        if use_cache:
+            cached, cache_key, embedding = await asyncio.to_thread(
+                self._lookup_cached, agent, user_input, use_cache, force_cache
+            )
+            if cached is not None:
+                return cached
+
+        first_trace = self.logger.trace_count
         current_agent = agent
-        handoff_count = 0
-
-        while handoff_count < max_handoffs:
-            # Prepare tools including handoff tools
-            tools_with_handoffs = current_agent.tools.copy()
-
-            # Add handoff tools for each available handoff agent
-            for handoff_agent in current_agent.handoffs:
-                handoff_tool = handoff_agent.create_handoff_tool()
-                if handoff_tool:
-                    tools_with_handoffs.append(handoff_tool)
-
-            # Temporarily set tools
-            original_tools = current_agent.tools
-            current_agent.tools = tools_with_handoffs
-            current_agent._tool_map = {tool.name: tool for tool in tools_with_handoffs}
-
-            # Run agent
-            result = self.run(current_agent, user_input, context)
-
-            # Restore original tools
-            current_agent.tools = original_tools
-            current_agent._tool_map = {tool.name: tool for tool in original_tools}
-
-            # Check if handoff occurred
-            if result.handoff_to:
-                handoff_count += 1
-                # Find the handoff agent
-                next_agent = current_agent.get_handoff_agent(result.handoff_to)
-                if next_agent:
-                    current_agent = next_agent
-                    context = Context(result.messages)
-                    user_input = f"[Continuing from {result.agent_name}]"
-                else:
-                    # Handoff agent not found, return result
-                    return result
-            else:
-                # No handoff, return final result
+        for _ in range(max_handoffs):
+            result = await self.arun(current_agent, user_input, context, handoffs=True)
+            handoff = self._follow_handoff(current_agent, result)
+            if handoff is None:
+                break
+            current_agent, context, user_input = handoff
+        else:
+            raise AgentError(f"Maximum handoffs ({max_handoffs}) exceeded")
+
+        if self.logger.verbose:
+            self.logger.flush()
+
+        if cache_key is not None or embedding is not None:
+            await asyncio.to_thread(
+                self._store_cached, agent, result, first_trace, cache_key, embedding
+            )
+
+        return result
+
+    def _lookup_cached(
+        self, agent: Agent, user_input: str, use_cache: bool, force_cache: bool
+    ) -> tuple[AgentResult | None, str | None, Any]:
+        """
+        Look a fresh conversation up in the response caches
+
+        Returns:
+            (cached result or None, exact cache key to store under, input embedding)
+        """
+        cache_key = None
+        if use_cache and self.cache is not None and (agent.temperature == 0 or force_cache):
+            cache_key = make_cache_key(agent, user_input)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return self._replay_cached(cached), cache_key, None
+
+        embedding = None
+        if use_cache and self.semantic_cache is not None:
+            embedding = self.semantic_cache.embed(user_input)
+            cached = self.semantic_cache.search(embedding, agent)
+            if cached is not None:
+                return self._replay_cached(cached), cache_key, embedding
+
+        return None, cache_key, embedding
+
+    def _store_cached(
+        self,
+        agent: Agent,
+        result: AgentResult,
+        first_trace: int,
+        cache_key: str | None,
+        embedding: Any,
+    ):
+        """Store a finished run (and the traces it recorded) in the response caches"""
+        entry = {
+            "output": result.output,
+            "agent_name": result.agent_name,
+            "traces": [asdict(t) for t in self.logger.traces_since(first_trace)],
+        }
+        if cache_key is not None:
+            self.cache.set(cache_key, entry)
+        if embedding is not None:
+            self.semantic_cache.add(embedding, agent, entry)
+
+    def _replay_cached(self, cached: dict[str, Any]) -> AgentResult:
+        """Build a result from a cache entry, replaying its traces into the logger"""
+        self.logger.add_traces(AgentTrace.from_dict(t) for t in cached["traces"])
+        return AgentResult(output=cached["output"], agent_name=cached["agent_name"], messages=())
+
+    def _run_handoff_chain(
+        self, agent: Agent, user_input: str, context: Context | None, max_handoffs: int
+    ) -> AgentResult:
+        """Run agents, following handoffs until one produces a final answer"""
+        current_agent = agent
+
+        for _ in range(max_handoffs):
+            # Run agent with its handoff tools exposed
+            result = self.run(current_agent, user_input, context, handoffs=True)
+            handoff = self._follow_handoff(current_agent, result)
+            if handoff is None:
                 return result
+            current_agent, context, user_input = handoff
 
         # Max handoffs reached
         raise AgentError(f"Maximum handoffs ({max_handoffs}) exceeded")
 
-    def _call_model(self, agent: Agent, context: Context):
+    def _follow_handoff(
+        self, agent: Agent, result: AgentResult
+    ) -> tuple[Agent, Context, str] | None:
+        """
+        Prepare the next agent of a handoff chain
+
+        Returns:
+            (next agent, its context, its user message), or None if the result is final
+            (no handoff, or the handoff agent was not found)
+        """
+        if not result.handoff_to:
+            return None
+
+        next_agent = agent.get_handoff_agent(result.handoff_to)
+        if not next_agent:
+            return None
+
+        # Keep the conversation so far as an unchanged (provider-cacheable) prefix
+        # and add the new agent's instructions after it rather than at the head
+        context = Context(result.messages)
+        context.add_system_message(next_agent.instructions)
+        return next_agent, context, f"[Continuing from {result.agent_name}]"
+
+    def run_batch(
+        self,
+        agent: Agent,
+        inputs: list[str],
+        max_handoffs: int = 5,
+        max_concurrency: int = 16,
+        return_exceptions: bool = False,
+    ) -> list[AgentResult]:
+        """
+        Run many independent inputs through an agent concurrently
+
+        Each run gets its own worker runner (and logger) sharing this runner's client,
+        so the HTTP connection pool and rate limiter are shared across the batch. Runs
+        execute on a thread pool, so this is safe to call from inside an event loop
+        thread (use run_batch_async there to avoid blocking it). Traces of every run,
+        failed or not, are appended to this runner's logger in input order.
+
+        Args:
+            agent: Initial agent for every input
+            inputs: User messages, one per run
+            max_handoffs: Maximum number of handoffs allowed per run
+            max_concurrency: Maximum number of runs in flight
+            return_exceptions: Return a failed run's exception in its place instead of
+                raising the first failure once the batch has finished
+
+        Returns:
+            AgentResults (or exceptions) in the same order as inputs
+        """
+        if not inputs:
+            return []
+
+        workers = [self._fork() for _ in inputs]
+        with ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(inputs)))) as executor:
+            futures = [
+                executor.submit(worker.run_with_handoffs, agent, user_input, None, max_handoffs)
+                for worker, user_input in zip(workers, inputs, strict=True)
+            ]
+
+        return self._collect_batch(
+            workers, [f.exception() or f.result() for f in futures], return_exceptions
+        )
+
+    async def run_batch_async(
+        self,
+        agent: Agent,
+        inputs: list[str],
+        max_handoffs: int = 5,
+        max_concurrency: int = 16,
+        return_exceptions: bool = False,
+    ) -> list[AgentResult]:
+        """
+        Async variant of run_batch
+
+        Runs go through arun_with_handoffs on this runner's async client, with at most
+        max_concurrency in flight, so no threads are held while waiting on the model.
+
+        Args:
+            agent: Initial agent for every input
+            inputs: User messages, one per run
+            max_handoffs: Maximum number of handoffs allowed per run
+            max_concurrency: Maximum number of runs in flight
+            return_exceptions: Return a failed run's exception in its place instead of
+                raising the first failure once the batch has finished
+
+        Returns:
+            AgentResults (or exceptions) in the same order as inputs
+        """
+        if not inputs:
+            return []
+
+        slots = asyncio.Semaphore(max_concurrency)
+        workers = [self._fork() for _ in inputs]
+
+        async def run_one(worker: Runner, user_input: str) -> AgentResult:
+            async with slots:
+                return await worker.arun_with_handoffs(agent, user_input, max_handoffs=max_handoffs)
+
+        results = await asyncio.gather(
+            *(
+                run_one(worker, user_input)
+                for worker, user_input in zip(workers, inputs, strict=True)
+            ),
+            return_exceptions=True,
+        )
+        return self._collect_batch(workers, results, return_exceptions)
+
+    def _collect_batch(
+        self, workers: list["Runner"], results: list[Any], return_exceptions: bool
+    ) -> list[AgentResult]:
+        """Record every worker's traces, then return the results or raise the first failure"""
+        for worker in workers:
+            self.logger.add_traces(worker.logger.traces)
+
+        if not return_exceptions:
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+
+        return results
+
+    def run_batch_api(
+        self,
+        agent: Agent,
+        inputs: list[str],
+        completion_window: str = "24h",
+        poll_interval: float = 5.0,
+        max_poll_interval: float = 60.0,
+    ) -> list[AgentResult]:
+        """
+        Run many inputs through the provider's Batch API (for large offline runs)
+
+        The first model turn of every input is submitted as one batch job, which is billed
+        at a discount but may take up to completion_window to finish. Batch requests are
+        single-turn, so inputs whose first response calls tools are finished with the
+        regular agent loop. Handoffs are not offered. Requires an endpoint implementing
+        the OpenAI files and batches APIs.
+
+        Args:
+            agent: Agent for every input
+            inputs: User messages, one per run
+            completion_window: Batch completion window requested from the provider
+            poll_interval: Initial seconds between batch status checks (doubles each check)
+            max_poll_interval: Upper bound on the seconds between status checks
+
+        Returns:
+            AgentResults in the same order as inputs
+
+        Raises:
+            AgentError: If the batch job fails, expires or is cancelled
+        """
+        if not inputs:
+            return []
+
+        contexts = []
+        lines = []
+        for index, user_input in enumerate(inputs):
+            context = Context()
+            context.add_system_message(agent.instructions)
+            context.add_user_message(user_input)
+            contexts.append(context)
+            request = {
+                "custom_id": str(index),
+                "method": "POST",
+                "url": _BATCH_ENDPOINT,
+                "body": self._build_api_params(agent, context, handoffs=False),
+            }
+            lines.append(serialization.dumps_bytes(request))
+
+        responses = self._submit_batch(
+            b"\n".join(lines), completion_window, poll_interval, max_poll_interval
+        )
+
+        results = []
+        for index, (user_input, context) in enumerate(zip(inputs, contexts, strict=True)):
+            response = responses.get(str(index))
+            if response is None:
+                # The request failed inside the batch; run it directly instead
+                results.append(self.run(agent, user_input))
+                continue
+
+            self.logger.start_agent(agent.name)
+            results.append(self._run_loop(agent, context, False, response))
+
+        return results
+
+    def _submit_batch(
+        self,
+        data: bytes,
+        completion_window: str,
+        poll_interval: float,
+        max_poll_interval: float,
+    ) -> dict[str, ChatCompletionMessage]:
+        """Upload a JSONL batch, wait for it to finish and return messages by custom_id"""
+        batch_file = self.client.files.create(file=("batch.jsonl", data), purpose="batch")
+        batch = self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint=_BATCH_ENDPOINT,
+            completion_window=completion_window,
+        )
+
+        delay = poll_interval
+        while batch.status not in _BATCH_FINAL_STATUSES:
+            time.sleep(delay)
+            delay = min(delay * 2, max_poll_interval)
+            batch = self.client.batches.retrieve(batch.id)
+
+        if batch.status != "completed":
+            raise AgentError(f"Batch {batch.id} ended with status '{batch.status}'")
+
+        responses = {}
+        if batch.output_file_id:
+            output = self.client.files.content(batch.output_file_id).text
+            for line in output.splitlines():
+                record = serialization.loads(line)
+                response = record.get("response") or {}
+                if response.get("status_code") == 200:
+                    responses[record["custom_id"]] = ChatCompletionMessage.model_validate(
+                        response["body"]["choices"][0]["message"]
+                    )
+        return responses
+
+    def _fork(self) -> "Runner":
+        """Create a worker runner sharing this runner's client and rate limiter"""
+        worker = Runner(client=self.client, verbose=self.logger.verbose, async_client=self._aclient)
+        # Workers share this runner's async client, creating it here on their first async call
+        worker._aclient_factory = lambda: self.aclient
+        worker.max_iterations = self.max_iterations
+        worker.stream = self.stream
+        worker.prompt_cache_key = self.prompt_cache_key
+        worker.rate_limiter = self.rate_limiter
+        worker.cache = self.cache
+        worker.semantic_cache = self.semantic_cache
+        return worker
+
+    def _call_model(self, agent: Agent, context: Context, handoffs: bool = False):
         """
         Call the model API
 
         Args:
             agent: Agent to use
             context: Current context
+            handoffs: Expose the agent's handoff tools
 
         Returns:
             Model response
         """
-        messages = context.get_messages_as_dict()
+        api_params = self._build_api_params(agent, context, handoffs)
+        self.logger.log_model_call(agent.model, len(api_params["messages"]))
+
+        # Respect the request budget before hitting the API
+        if self.rate_limiter:
+            self.rate_limiter.acquire()
+
+        # Call API
+        if self.stream:
+            api_params["stream"] = True
+            message = collect_stream(
+                self.client.chat.completions.create(**api_params),
+                on_content=self.logger.log_model_delta,
+            )
+            self.logger.end_model_stream()
+            return message
+
+        response = self.client.chat.completions.create(**api_params)
+
+        return response.choices[0].message
+
+    async def _acall_model(self, agent: Agent, context: Context, handoffs: bool = False):
+        """
+        Call the model API through the async client
+
+        Falls back to the sync client on a worker thread when no async client is set.
+
+        Args:
+            agent: Agent to use
+            context: Current context
+            handoffs: Expose the agent's handoff tools
+
+        Returns:
+            Model response
+        """
+        if self.aclient is None:
+            return await asyncio.to_thread(self._call_model, agent, context, handoffs)
 
-        # Log model call
-        self.logger.log_model_call(agent.model, len(messages))
+        api_params = self._build_api_params(agent, context, handoffs)
+        self.logger.log_model_call(agent.model, len(api_params["messages"]))
+
+        if self.rate_limiter:
+            await asyncio.to_thread(self.rate_limiter.acquire)
+
+        if self.stream:
+            api_params["stream"] = True
+            message = await acollect_stream(
+                await self.aclient.chat.completions.create(**api_params),
+                on_content=self.logger.log_model_delta,
+            )
+            self.logger.end_model_stream()
+            return message
+
+        response = await self.aclient.chat.completions.create(**api_params)
+
+        return response.choices[0].message
+
+    def _build_api_params(self, agent: Agent, context: Context, handoffs: bool) -> dict[str, Any]:
+        """Build chat completion parameters for the agent's next turn"""
+        messages = context.get_messages_as_dict()
 
         # Build API call parameters
         api_params = {
@@ -281,14 +927,73 @@ class Runner:
         }
 
         # Add tools if agent has them
-        if agent.has_tools():
-            api_params["tools"] = agent.get_tools_for_api()
+        api_tools = agent.get_tools_for_api(include_handoffs=handoffs)
+        if api_tools:
+            api_params["tools"] = api_tools
             api_params["tool_choice"] = "auto"
 
-        # Call API
-        response = self.client.chat.completions.create(**api_params)
+        # Requests sharing a key share a cached prefix: the agent's system prompt and tools
+        if self.prompt_cache_key:
+            api_params["prompt_cache_key"] = f"{agent.model}:{agent.name}"
 
-        return response.choices[0].message
+        return api_params
+
+    @property
+    def aclient(self) -> AsyncOpenAI | None:
+        """Async client used by arun, created on first use if the runner owns it"""
+        if self._aclient is None and self._aclient_factory is not None:
+            self._aclient = self._aclient_factory()
+        return self._aclient
+
+    def close(self):
+        """
+        Close the async HTTP connection pool if this runner created one
+
+        The default sync client is shared by runners for the same endpoint and stays open.
+        Called from a running event loop, the pool is closed in a background task; prefer
+        aclose (or async with) there.
+        """
+        aclient = self._release_aclient()
+        if aclient is None:
+            return
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # The pool's connections belong to the loop arun ran on; if that loop has
+            # finished they cannot be closed gracefully and are dropped with the client
+            with contextlib.suppress(RuntimeError):
+                asyncio.run(aclient.close())
+            return
+
+        task = loop.create_task(aclient.close())
+        _PENDING_CLOSES.add(task)
+        task.add_done_callback(_PENDING_CLOSES.discard)
+
+    async def aclose(self):
+        """Close the async HTTP connection pool if this runner created one"""
+        aclient = self._release_aclient()
+        if aclient is not None:
+            await aclient.close()
+
+    def _release_aclient(self) -> AsyncOpenAI | None:
+        """Detach the owned async client if it was created (a later arun creates a new one)"""
+        if not self._owns_aclient or self._aclient is None:
+            return None
+        aclient, self._aclient = self._aclient, None
+        return aclient
+
+    def __enter__(self) -> "Runner":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    async def __aenter__(self) -> "Runner":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
 
     def get_summary(self) -> str:
         """
@@ -298,3 +1003,47 @@ class Runner:
             Formatted summary string
         """
         return self.logger.get_summary()
+
+
+def _new_async_client(base_url: str, api_key: str) -> AsyncOpenAI:
+    """Pooled async client owned by one runner (async pools are bound to an event loop)"""
+    http_client = DefaultAsyncHttpxClient(
+        http2=HTTP2_AVAILABLE, limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT
+    )
+    return AsyncOpenAI(base_url=base_url, api_key=api_key, http_client=http_client)
+
+
+@functools.lru_cache(maxsize=4)
+def _get_client(base_url: str, api_key: str) -> OpenAI:
+    """Pooled sync client shared by every runner created for the same endpoint and key"""
+    http_client = DefaultHttpxClient(
+        http2=HTTP2_AVAILABLE, limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT
+    )
+    return OpenAI(base_url=base_url, api_key=api_key, http_client=http_client)
+
+
+def _tool_call_signature(tool_calls: list[Any]) -> frozenset[tuple[str, str]]:
+    """(name, arguments) pairs of an iteration's tool calls"""
+    return frozenset((tc.function.name, tc.function.arguments) for tc in tool_calls)
+
+
+def _dedupe_tool_calls(tool_calls: list[Any]) -> tuple[list[Any], list[int]]:
+    """
+    Collapse identical tool calls (same name and arguments) from one response
+
+    Args:
+        tool_calls: Tool calls in call order
+
+    Returns:
+        (unique tool calls, index into them for each original call)
+    """
+    first_seen: dict[tuple[str, str], int] = {}
+    unique = []
+    positions = []
+    for tool_call in tool_calls:
+        key = (tool_call.function.name, tool_call.function.arguments)
+        if key not in first_seen:
+            first_seen[key] = len(unique)
+            unique.append(tool_call)
+        positions.append(first_seen[key])
+    return unique, positions
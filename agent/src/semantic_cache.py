@@ -0,0 +1,173 @@
+import threading
+from collections.abc import Callable
+from typing import Any
+
+import numpy as np
+
+from .agent import Agent
+
+try:
+    import numba
+except ImportError:  # pragma: no cover - optional speedup
+    numba = None
+
+EmbedFunction = Callable[[str], np.ndarray]
+
+DEFAULT_EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+
+
+class SemanticCache:
+    """
+    Response cache keyed by prompt meaning rather than exact text
+
+    Prompts are embedded into L2-normalized float32 vectors stored row-wise in one
+    contiguous matrix, so a lookup is a single matrix-vector product.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.92,
+        embed: EmbedFunction | None = None,
+        model_name: str = DEFAULT_EMBEDDING_MODEL,
+        initial_capacity: int = 256,
+    ):
+        """
+        Initialize the cache
+
+        Args:
+            threshold: Minimum cosine similarity for a hit
+            embed: Function mapping text to a vector (defaults to sentence-transformers)
+            model_name: sentence-transformers model used when embed is not provided
+            initial_capacity: Rows preallocated for embeddings
+        """
+        self.threshold = threshold
+        self.model_name = model_name
+        self._embed = embed
+        self._vectors: np.ndarray | None = None
+        self._capacity = initial_capacity
+        self._size = 0
+        self._agent_keys: list[str] = []
+        self._values: list[dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    def embed(self, text: str) -> np.ndarray:
+        """
+        Embed text as an L2-normalized float32 vector
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            1-D embedding
+        """
+        if self._embed is None:
+            self._embed = self._load_default_embedder()
+
+        vector = np.asarray(self._embed(text), dtype=np.float32).ravel()
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
+
+    def search(self, embedding: np.ndarray, agent: Agent) -> dict[str, Any] | None:
+        """
+        Find the cached response closest to an embedding
+
+        Args:
+            embedding: Normalized query embedding
+            agent: Entry agent the response must have been produced by
+
+        Returns:
+            Cached value or None on miss
+        """
+        with self._lock:
+            if self._size == 0:
+                return None
+
+            best, score = _top1_cosine(embedding, self._vectors[: self._size])
+            if score < self.threshold or self._agent_keys[best] != _agent_key(agent):
+                return None
+
+            return self._values[best]
+
+    def add(self, embedding: np.ndarray, agent: Agent, value: dict[str, Any]) -> None:
+        """
+        Store a response under an embedding
+
+        Args:
+            embedding: Normalized prompt embedding
+            agent: Entry agent that produced the response
+            value: Cached response
+        """
+        with self._lock:
+            if self._vectors is None:
+                self._vectors = np.empty((self._capacity, embedding.shape[0]), dtype=np.float32)
+            elif self._size == self._capacity:
+                self._capacity *= 2
+                grown = np.empty((self._capacity, self._vectors.shape[1]), dtype=np.float32)
+                grown[: self._size] = self._vectors[: self._size]
+                self._vectors = grown
+
+            self._vectors[self._size] = embedding
+            self._agent_keys.append(_agent_key(agent))
+            self._values.append(value)
+            self._size += 1
+
+    def clear(self):
+        """Drop all entries"""
+        with self._lock:
+            self._vectors = None
+            self._size = 0
+            self._agent_keys = []
+            self._values = []
+
+    def _load_default_embedder(self) -> EmbedFunction:
+        from sentence_transformers import SentenceTransformer
+
+        model = SentenceTransformer(self.model_name)
+        return lambda text: model.encode(text, normalize_embeddings=True)
+
+    def __len__(self):
+        return self._size
+
+    def __repr__(self):
+        return f"SemanticCache(entries={self._size}, threshold={self.threshold})"
+
+
+# Above this many rows BLAS (already vectorized and threaded) outruns the fused kernel
+NUMBA_MAX_ROWS = 4096
+
+
+def _top1_numpy(query: np.ndarray, matrix: np.ndarray) -> tuple[int, float]:
+    scores = matrix @ query
+    best = int(np.argmax(scores))
+    return best, float(scores[best])
+
+
+if numba is not None:
+
+    @numba.njit(fastmath=True, cache=True)
+    def _top1_numba(query, matrix):  # pragma: no cover - compiled
+        # Fused dot product + argmax: no temporary scores array, no per-call dispatch
+        best = 0
+        best_score = np.float32(-np.inf)
+        for i in range(matrix.shape[0]):
+            score = np.float32(0.0)
+            for j in range(matrix.shape[1]):
+                score += query[j] * matrix[i, j]
+            if score > best_score:
+                best = i
+                best_score = score
+        return best, best_score
+
+    def _top1_cosine(query: np.ndarray, matrix: np.ndarray) -> tuple[int, float]:
+        """Best match by dot product (cosine, as rows are normalized)"""
+        if matrix.shape[0] > NUMBA_MAX_ROWS:
+            return _top1_numpy(query, matrix)
+        best, score = _top1_numba(query, matrix)
+        return int(best), float(score)
+
+else:
+    _top1_cosine = _top1_numpy
+
+
+def _agent_key(agent: Agent) -> str:
+    return f"{agent.name}|{agent.model}"
@@ -0,0 +1,75 @@
+"""
+JSON helpers for the agent <-> API boundary
+
+Uses orjson when it is installed and falls back to the standard library.
+"""
+
+import dataclasses
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_DATACLASS if orjson else 0
+
+
+def _default(obj: Any) -> Any:
+    """Serialize objects the JSON encoders do not handle natively"""
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    if isinstance(obj, set | frozenset | tuple):
+        return list(obj)
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump()
+    return str(obj)
+
+
+def dumps(obj: Any) -> str:
+    """
+    Serialize an object to a JSON string
+
+    Args:
+        obj: Object to serialize
+
+    Returns:
+        JSON text
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=_default, option=_ORJSON_OPTIONS).decode()
+    return json.dumps(obj, default=_default)
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """
+    Serialize an object to UTF-8 JSON bytes, skipping the str round trip for byte sinks
+
+    Args:
+        obj: Object to serialize
+
+    Returns:
+        JSON bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=_default, option=_ORJSON_OPTIONS)
+    return json.dumps(obj, default=_default).encode()
+
+
+def loads(data: str | bytes) -> Any:
+    """
+    Parse JSON text
+
+    Args:
+        data: JSON string or bytes
+
+    Returns:
+        Parsed object
+
+    Raises:
+        ValueError: If data is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
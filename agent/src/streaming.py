@@ -0,0 +1,145 @@
+from collections.abc import Callable
+from typing import Any
+
+from openai.types.chat import ChatCompletionMessage
+
+from . import serialization
+
+HANDOFF_PREFIX = "handoff_to_"
+
+
+class _StreamAssembler:
+    """
+    Merges chat completion chunks into one assistant message
+    """
+
+    def __init__(self, stop_on_handoff: bool, on_content: Callable[[str], None] | None):
+        self.stop_on_handoff = stop_on_handoff
+        self.on_content = on_content
+        self.content: list[str] = []
+        self.tool_calls: list[dict[str, Any]] = []
+
+    def add(self, chunk: Any) -> bool:
+        """
+        Merge a chunk
+
+        Args:
+            chunk: Chat completion chunk
+
+        Returns:
+            True once generation can stop (a handoff tool call is complete)
+        """
+        if not chunk.choices:
+            return False
+
+        delta = chunk.choices[0].delta
+        if delta.content:
+            self.content.append(delta.content)
+            if self.on_content is not None:
+                self.on_content(delta.content)
+
+        for tc_delta in delta.tool_calls or ():
+            while len(self.tool_calls) <= tc_delta.index:
+                self.tool_calls.append(
+                    {"id": "", "type": "function", "function": {"name": "", "arguments": ""}}
+                )
+
+            call = self.tool_calls[tc_delta.index]
+            if tc_delta.id:
+                call["id"] = tc_delta.id
+            if tc_delta.function:
+                if tc_delta.function.name:
+                    call["function"]["name"] += tc_delta.function.name
+                if tc_delta.function.arguments:
+                    call["function"]["arguments"] += tc_delta.function.arguments
+
+            if self.stop_on_handoff and _is_complete_handoff(call):
+                del self.tool_calls[tc_delta.index + 1 :]
+                return True
+
+        return False
+
+    def message(self) -> ChatCompletionMessage:
+        return ChatCompletionMessage(
+            role="assistant",
+            content="".join(self.content) or None,
+            tool_calls=self.tool_calls or None,
+        )
+
+
+def collect_stream(
+    stream: Any,
+    stop_on_handoff: bool = True,
+    on_content: Callable[[str], None] | None = None,
+) -> ChatCompletionMessage:
+    """
+    Assemble a streamed chat completion into a single assistant message
+
+    Tool call deltas are merged by index. When stop_on_handoff is set, the stream is
+    closed as soon as a handoff tool call has its complete arguments, since the
+    runner hands off at that call and ignores anything generated after it.
+
+    Args:
+        stream: Iterable of chat completion chunks (closed when done)
+        stop_on_handoff: Abort generation once a handoff tool call is complete
+        on_content: Called with each content delta as it arrives
+
+    Returns:
+        Assistant message with the same shape as a non-streamed response
+    """
+    assembler = _StreamAssembler(stop_on_handoff, on_content)
+    try:
+        for chunk in stream:
+            if assembler.add(chunk):
+                break
+    finally:
+        close = getattr(stream, "close", None)
+        if close is not None:
+            close()
+
+    return assembler.message()
+
+
+async def acollect_stream(
+    stream: Any,
+    stop_on_handoff: bool = True,
+    on_content: Callable[[str], None] | None = None,
+) -> ChatCompletionMessage:
+    """
+    Async variant of collect_stream
+
+    Args:
+        stream: Async iterable of chat completion chunks (closed when done)
+        stop_on_handoff: Abort generation once a handoff tool call is complete
+        on_content: Called with each content delta as it arrives
+
+    Returns:
+        Assistant message with the same shape as a non-streamed response
+    """
+    assembler = _StreamAssembler(stop_on_handoff, on_content)
+    try:
+        async for chunk in stream:
+            if assembler.add(chunk):
+                break
+    finally:
+        close = getattr(stream, "close", None)
+        if close is not None:
+            await close()
+
+    return assembler.message()
+
+
+def _is_complete_handoff(call: dict[str, Any]) -> bool:
+    function = call["function"]
+    if not function["name"].startswith(HANDOFF_PREFIX):
+        return False
+
+    arguments = function["arguments"].rstrip()
+    if not arguments.endswith("}"):
+        return False
+
+    try:
+        serialization.loads(arguments)
+    except ValueError:
+        return False
+    return True
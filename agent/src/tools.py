@@ -1,9 +1,41 @@
+import copy
+import functools
 import inspect
-import json
+import sys
+import types
 from collections.abc import Callable
-from typing import Any, get_type_hints
-
-from .exceptions import ToolError
+from typing import Any, Union, get_args, get_origin, get_type_hints
+
+from . import serialization
+from .exceptions import ToolError, ValidationError
+
+try:
+    import fastjsonschema
+except ImportError:  # pragma: no cover - optional speedup
+    fastjsonschema = None
+
+# Python types accepted for each JSON schema type
+_JSON_SCHEMA_TYPES: dict[str, type | tuple[type, ...]] = {
+    "integer": int,
+    "number": (int, float),
+    "string": str,
+    "boolean": bool,
+    "array": list,
+    "object": dict,
+    "null": type(None),
+}
+
+# Python annotation -> JSON schema type used by the @tool decorator
+_TYPE_MAPPING: dict[type, str] = {
+    int: "integer",
+    float: "number",
+    str: "string",
+    bool: "boolean",
+    list: "array",
+    dict: "object",
+}
+
+ArgumentValidator = Callable[[dict[str, Any]], None]
 
 
 class Tool:
@@ -23,19 +55,12 @@ class Tool:
             description: Tool description
             parameters_schema: JSON schema for parameters
         """
-        self.name = name
+        self.name = sys.intern(name)
         self.function = function
         self.description = description
         self.parameters_schema = parameters_schema
-
-    def to_openai_format(self) -> dict[str, Any]:
-        """
-        Convert tool to OpenAI function calling format
-
-        Returns:
-            Tool definition in OpenAI format
-        """
-        return {
+        self._validate = _compile_validator(parameters_schema)
+        self._openai_format = {
             "type": "function",
             "function": {
                 "name": self.name,
@@ -44,6 +69,15 @@ class Tool:
             },
         }
 
+    def to_openai_format(self) -> dict[str, Any]:
+        """
+        Convert tool to OpenAI function calling format
+
+        Returns:
+            Tool definition in OpenAI format (shared, do not mutate)
+        """
+        return self._openai_format
+
     def execute(self, arguments: dict[str, Any]) -> Any:
         """
         Execute the tool with given arguments
@@ -55,8 +89,11 @@ class Tool:
             Tool execution result
 
         Raises:
+            ValidationError: If arguments do not match the parameters schema
             ToolError: If tool execution fails
         """
+        self._validate(arguments)
+
         try:
             return self.function(**arguments)
         except Exception as e:
@@ -105,11 +142,17 @@ def tool(description: str | None = None):
             # Convert Python types to JSON schema types
             json_type = _python_type_to_json_type(param_type)
 
-            properties[param_name] = {"type": json_type, "description": f"Parameter {param_name}"}
-
-            # Check if parameter is required (no default value)
+            # Check if parameter is required (no default value); optional parameters
+            # also accept null, which leaves them at None
             if param.default == inspect.Parameter.empty:
                 required.append(param_name)
+            elif "null" not in json_type:
+                json_type = [*json_type, "null"]
+
+            properties[param_name] = {
+                "type": json_type[0] if len(json_type) == 1 else json_type,
+                "description": f"Parameter {param_name}",
+            }
 
         parameters_schema = {"type": "object", "properties": properties, "required": required}
 
@@ -124,61 +167,143 @@ def tool(description: str | None = None):
     return decorator
 
 
-def _python_type_to_json_type(python_type: type) -> str:
+def _compile_validator(schema: dict[str, Any]) -> ArgumentValidator:
     """
-    Convert Python type to JSON schema type
+    Build an argument validator for a parameters schema once, at tool construction
+
+    Uses fastjsonschema's generated code when installed; otherwise checks required
+    arguments and the JSON type of each declared property.
 
     Args:
-        python_type: Python type
+        schema: JSON schema for the tool parameters
 
     Returns:
-        JSON schema type string
+        Function raising ValidationError for arguments that do not match
     """
-    type_mapping = {
-        int: "integer",
-        float: "number",
-        str: "string",
-        bool: "boolean",
-        list: "array",
-        dict: "object",
-    }
-
-    # Handle Optional types
-    if hasattr(python_type, "__origin__"):
-        if python_type.__origin__ is list:
-            return "array"
-        elif python_type.__origin__ is dict:
-            return "object"
-
-    return type_mapping.get(python_type, "string")
-
-
-def execute_tool_call(tool: Tool, tool_call) -> str:
+    if fastjsonschema is not None:
+        compiled = fastjsonschema.compile(schema)
+
+        def validate(arguments: dict[str, Any]) -> None:
+            try:
+                compiled(arguments)
+            except fastjsonschema.JsonSchemaException as e:
+                raise ValidationError(f"Invalid arguments: {e.message}") from e
+
+        return validate
+
+    required = tuple(schema.get("required", ()))
+    typed = []
+    for name, prop in schema.get("properties", {}).items():
+        json_types = prop.get("type")
+        if isinstance(json_types, str):
+            json_types = (json_types,)
+        # Properties with an unknown (or no) type are not checked
+        if json_types and all(t in _JSON_SCHEMA_TYPES for t in json_types):
+            typed.append((name, tuple(json_types)))
+
+    def validate(arguments: dict[str, Any]) -> None:
+        if not isinstance(arguments, dict):
+            raise ValidationError("Invalid arguments: expected a JSON object")
+
+        for name in required:
+            if name not in arguments:
+                raise ValidationError(f"Invalid arguments: missing required '{name}'")
+
+        for name, json_types in typed:
+            if name not in arguments:
+                continue
+            value = arguments[name]
+            if not any(_is_json_type(value, json_type) for json_type in json_types):
+                raise ValidationError(f"Invalid arguments: '{name}' has the wrong type")
+
+    return validate
+
+
+def _is_json_type(value: Any, json_type: str) -> bool:
+    """Whether a decoded JSON value is an instance of a JSON schema type"""
+    # bool is an int subclass but not a JSON integer/number
+    if isinstance(value, bool):
+        return json_type == "boolean"
+    # JSON Schema counts numbers with a zero fractional part (2.0) as integers
+    if json_type == "integer" and isinstance(value, float):
+        return value.is_integer()
+    return isinstance(value, _JSON_SCHEMA_TYPES[json_type])
+
+
+def _python_type_to_json_type(python_type: Any) -> list[str]:
+    """
+    Convert Python type to JSON schema types
+
+    Args:
+        python_type: Python type annotation
+
+    Returns:
+        JSON schema type names; Optional and union annotations give one per member
+        (None maps to "null"), anything unrecognized maps to "string"
+    """
+    origin = get_origin(python_type)
+
+    # Handle Optional and union types (X | None, Optional[X], Union[X, Y])
+    if origin is Union or origin is types.UnionType:
+        json_types = []
+        for arg in get_args(python_type):
+            for json_type in _python_type_to_json_type(arg):
+                if json_type not in json_types:
+                    json_types.append(json_type)
+        return json_types
+
+    if python_type is type(None):
+        return ["null"]
+    if origin is list:
+        return ["array"]
+    if origin is dict:
+        return ["object"]
+
+    return [_TYPE_MAPPING.get(python_type, "string")]
+
+
+def execute_tool_call(tool: Tool, arguments: dict[str, Any]) -> str:
     """
     Execute a tool call and return the result as a string
 
     Args:
         tool: Tool to execute
-        tool_call: Tool call object from model response
+        arguments: Parsed tool call arguments (see parse_arguments)
 
     Returns:
         String representation of the result
     """
     try:
-        # Parse arguments
-        if isinstance(tool_call.function.arguments, str):
-            arguments = json.loads(tool_call.function.arguments)
-        else:
-            arguments = tool_call.function.arguments
-
         # Execute tool
         result = tool.execute(arguments)
 
         # Convert result to string
         if isinstance(result, dict | list):
-            return json.dumps(result)
+            return serialization.dumps(result)
         else:
             return str(result)
 
     except Exception as e:
         return f"Error: {e!s}"
+
+
+def parse_arguments(text: str) -> Any:
+    """
+    Parse a tool call's JSON arguments, reusing results for repeated argument strings
+
+    Args:
+        text: JSON arguments from the model
+
+    Returns:
+        Parsed arguments (a fresh copy, so tools may mutate nested lists and dicts)
+
+    Raises:
+        ValueError: If text is not valid JSON
+    """
+    parsed = _parse_arguments_cached(text)
+    return copy.deepcopy(parsed) if isinstance(parsed, dict | list) else parsed
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_arguments_cached(text: str) -> Any:
+    return serialization.loads(text)
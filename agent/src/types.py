@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class Message:
     """Represents a message in the conversation"""
 
@@ -13,6 +13,24 @@ class Message:
     tool_calls: list[dict[str, Any]] | None = None
     tool_call_id: str | None = None
 
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to the dictionary format used by the chat completions API"""
+        msg_dict: dict[str, Any] = {"role": self.role}
+
+        if self.content:
+            msg_dict["content"] = self.content
+
+        if self.name:
+            msg_dict["name"] = self.name
+
+        if self.tool_calls:
+            msg_dict["tool_calls"] = self.tool_calls
+
+        if self.tool_call_id:
+            msg_dict["tool_call_id"] = self.tool_call_id
+
+        return msg_dict
+
 
 @dataclass
 class ToolCall:
@@ -41,7 +59,7 @@ class AgentResult:
         self,
         output: str,
         agent_name: str,
-        messages: list[Message],
+        messages: tuple[Message, ...],
         tool_calls: list[ToolCall] | None = None,
         handoff_to: str | None = None,
     ):
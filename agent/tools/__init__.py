@@ -1,9 +1,11 @@
+from ._text import CanonText
 from .compliance_tools import detect_compliance_violation
 from .ems_tools import detect_ems_hazard
 from .fire_tools import detect_fire_hazard
 from .notification_tools import send_site_alert
 
 __all__ = [
+    "CanonText",
     "detect_compliance_violation",
     "detect_ems_hazard",
     "detect_fire_hazard",
@@ -0,0 +1,46 @@
+"""
+Canonical description text shared across detectors
+"""
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class CanonText:
+    """
+    A description with its canonical form computed once
+
+    Pass one CanonText to every detector that examines the same description, so
+    the text is lowercased once rather than once per detector.
+    """
+
+    raw: str
+    lower: str
+
+    @classmethod
+    def from_raw(cls, raw: str) -> "CanonText":
+        """
+        Canonicalize a raw description
+
+        Args:
+            raw: Description as reported
+
+        Returns:
+            CanonText whose lower form is lowercased and stripped
+        """
+        return cls(raw, raw.lower().strip())
+
+
+def canonical(description: str | CanonText) -> str:
+    """
+    Lowercased, stripped form of a description
+
+    Args:
+        description: Raw description or a prebuilt CanonText
+
+    Returns:
+        Canonical text, reused from a CanonText when given one
+    """
+    if isinstance(description, CanonText):
+        return description.lower
+    return description.lower().strip()
@@ -0,0 +1,121 @@
+"""
+Bulk hazard scoring for offline replay of many descriptions
+
+Online tool calls score one description at a time through detection.scan; this
+module scores a whole batch at once. With numba installed the keyword table is
+compiled into a byte-level Aho-Corasick automaton and all descriptions are walked
+in one jitted, parallel pass. Without numba it falls back to the per-string scanner.
+
+Requires numpy; install the replay extra for numpy and numba.
+"""
+
+import functools
+from collections.abc import Sequence
+
+import numpy as np
+
+from ._text import CanonText, canonical
+from .detection import SCANNERS, scan
+
+try:
+    import numba
+except ImportError:  # pragma: no cover - optional speedup
+    numba = None
+
+# Matched keywords are tracked as bits of one int64 per automaton state
+_MAX_KEYWORDS = 63
+
+
+@functools.cache
+def _automaton_tables(kind: str) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Compile one hazard's keyword table into a dense byte-level automaton
+
+    Args:
+        kind: Hazard kind (a key of SCANNERS)
+
+    Returns:
+        (transitions[state, byte] -> state, keyword bitmask per state, keyword weights)
+    """
+    scanner = SCANNERS[kind]
+    if len(scanner.keywords) > _MAX_KEYWORDS:
+        raise ValueError(f"{kind} has more than {_MAX_KEYWORDS} keywords")
+
+    # Trie over UTF-8 bytes; a substring test on str is a substring test on its UTF-8
+    children: list[dict[int, int]] = [{}]
+    output = [0]
+    for index, keyword in enumerate(scanner.keywords):
+        state = 0
+        for byte in keyword.encode():
+            if byte not in children[state]:
+                children[state][byte] = len(children)
+                children.append({})
+                output.append(0)
+            state = children[state][byte]
+        output[state] |= 1 << index
+
+    # Breadth-first over the trie: each state starts from its failure state's row,
+    # which is already complete since failure states are strictly shallower
+    transitions = np.zeros((len(children), 256), dtype=np.int32)
+    fail = [0] * len(children)
+    queue = [0]
+    for state in queue:
+        if state:
+            transitions[state] = transitions[fail[state]]
+            output[state] |= output[fail[state]]
+        for byte, child in children[state].items():
+            fail[child] = transitions[fail[state], byte] if state else 0
+            transitions[state, byte] = child
+            queue.append(child)
+
+    return (
+        transitions,
+        np.array(output, dtype=np.int64),
+        np.array(scanner.weights, dtype=np.int64),
+    )
+
+
+if numba is not None:
+
+    @numba.njit(cache=True, parallel=True)
+    def _scan_buffer(buffer, offsets, transitions, output, weights):  # pragma: no cover - compiled
+        scores = np.zeros(offsets.shape[0] - 1, dtype=np.int64)
+        for row in numba.prange(scores.shape[0]):
+            state = 0
+            matched = 0
+            for i in range(offsets[row], offsets[row + 1]):
+                state = transitions[state, buffer[i]]
+                matched |= output[state]
+            score = 0
+            for k in range(weights.shape[0]):
+                if (matched >> k) & 1:
+                    score += weights[k]
+            scores[row] = score
+        return scores
+
+
+def scan_batch(kind: str, descriptions: Sequence[str | CanonText]) -> np.ndarray:
+    """
+    Score many descriptions against one hazard's keyword table
+
+    Scores match detection.scan on each lowercased, stripped description. Meant for
+    bulk replay; single online calls are faster through detection.scan, as the
+    jitted path only pays off once its encoding and dispatch are amortized.
+
+    Args:
+        kind: Hazard kind (a key of SCANNERS)
+        descriptions: Raw descriptions or prebuilt CanonText
+
+    Returns:
+        int64 array of keyword scores, one per description
+    """
+    texts = [canonical(description) for description in descriptions]
+    if numba is None:
+        return np.array([scan(kind, text)[0] for text in texts], dtype=np.int64)
+
+    encoded = [text.encode() for text in texts]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(data) for data in encoded], out=offsets[1:])
+    buffer = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+
+    return _scan_buffer(buffer, offsets, *_automaton_tables(kind))
@@ -2,65 +2,97 @@
 PPE compliance and safety violation detection tools
 """
 
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+
 from ..src.tools import tool
-from .notification_tools import mock_safety_api_call
+from ._text import CanonText, canonical
+from .detection import classify
+from .notification_tools import IncidentResponse, mock_safety_api_call
 
+# Constant response tails, each starting with the line break that joins it to the report
+_WORK_STOPPAGE = "\n\nWORK STOPPAGE ISSUED\nSite supervisor and safety manager notified"
+_COMPLIANCE_ACTIONS = "\n".join(
+    [
+        "\n\nCompliance Actions Required:",
+        "1. Stop worker - no entry to hazard area",
+        "2. Provide required PPE immediately",
+        "3. Document violation in worker file",
+        "4. Retrain on PPE requirements",
+        "5. Verify PPE fit and proper use before resuming work",
+    ]
+)
 
-@tool(description="Detect PPE violations and enforce compliance")
-def detect_compliance_violation(description: str) -> str:
-    violation_keywords = {
-        "no hard hat": 9,
-        "missing hard hat": 9,
-        "without hard hat": 9,
-        "no harness": 10,
-        "no fall protection": 10,
-        "no safety glasses": 7,
-        "no hearing protection": 6,
-        "no high-vis": 8,
-        "no vest": 8,
-        "no respirator": 8,
-        "improper ppe": 6,
-    }
-
-    violation_score = 0
-    detected_violations = []
-
-    desc_lower = description.lower()
-    for keyword, weight in violation_keywords.items():
-        if keyword in desc_lower:
-            violation_score += weight
-            detected_violations.append(keyword)
-
-    if violation_score == 0:
-        return "PPE compliance satisfactory. Continue monitoring."
 
-    if violation_score >= 9:
-        severity = "CRITICAL"
-    elif violation_score >= 6:
-        severity = "HIGH"
-    else:
-        severity = "MODERATE"
+# Identical violations reported within the TTL share one logged incident. Entries hold
+# a future so that concurrent reports of a violation still being logged wait for it
+INCIDENT_TTL_SECONDS = 60.0
+_MAX_RECENT_INCIDENTS = 1024
+_recent_incidents: OrderedDict[str, tuple[float, Future[IncidentResponse]]] = OrderedDict()
+_recent_incidents_lock = threading.Lock()
 
-    response_parts = [f"PPE VIOLATION - Severity: {severity}"]
-    response_parts.append(f"Violations: {', '.join(detected_violations)}")
 
-    # Log to safety system
-    api_response = mock_safety_api_call(
-        incident_type="PPE Compliance Violation",
-        severity=severity,
-        data={"violations": detected_violations, "violation_score": violation_score},
-    )
-    response_parts.append(f"\nIncident ID: {api_response['incident_id']}")
+def _log_incident(
+    severity: str, detected: tuple[str, ...], violation_score: int
+) -> IncidentResponse:
+    """Log a violation with the safety API unless the same one was logged recently"""
+    key = hashlib.blake2b(
+        f"{severity}|{'|'.join(sorted(detected))}".encode(), digest_size=8
+    ).hexdigest()
+    now = time.monotonic()
+
+    # Look up or claim the key in one critical section, so only one caller logs it
+    with _recent_incidents_lock:
+        entry = _recent_incidents.get(key)
+        if entry is not None and now - entry[0] < INCIDENT_TTL_SECONDS:
+            _recent_incidents.move_to_end(key)
+            pending = entry[1]
+        else:
+            pending = None
+            incident: Future[IncidentResponse] = Future()
+            _recent_incidents[key] = (now, incident)
+            _recent_incidents.move_to_end(key)
+            if len(_recent_incidents) > _MAX_RECENT_INCIDENTS:
+                _recent_incidents.popitem(last=False)
+
+    if pending is not None:
+        return pending.result()
+
+    try:
+        api_response = mock_safety_api_call(
+            incident_type="PPE Compliance Violation",
+            severity=severity,
+            data={"violations": list(detected), "violation_score": violation_score},
+        )
+    except BaseException as e:
+        # Let the next report retry rather than replaying the failure for the TTL
+        with _recent_incidents_lock:
+            if _recent_incidents.get(key, (None, None))[1] is incident:
+                del _recent_incidents[key]
+        incident.set_exception(e)
+        raise
 
-    if severity == "CRITICAL":
-        response_parts.append("\nWORK STOPPAGE ISSUED")
-        response_parts.append("Site supervisor and safety manager notified")
+    incident.set_result(api_response)
+    return api_response
 
-    response_parts.append("\nCompliance Actions Required:")
-    response_parts.append("1. Stop worker - no entry to hazard area")
-    response_parts.append("2. Provide required PPE immediately")
-    response_parts.append("3. Document violation in worker file")
-    response_parts.append("4. Retrain on PPE requirements")
-    response_parts.append("5. Verify PPE fit and proper use before resuming work")
 
-    return "\n".join(response_parts)
+@tool(description="Detect PPE violations and enforce compliance")
+def detect_compliance_violation(description: str | CanonText) -> str:
+    violation_score, detected, severity = classify("ppe", canonical(description))
+
+    if severity is None:
+        return "PPE compliance satisfactory. Continue monitoring."
+
+    # Log to safety system
+    api_response = _log_incident(severity, detected, violation_score)
+
+    return (
+        f"PPE VIOLATION - Severity: {severity}\n"
+        f"Violations: {', '.join(detected)}\n"
+        f"\nIncident ID: {api_response.incident_id}"
+        f"{_WORK_STOPPAGE if severity == 'CRITICAL' else ''}"
+        f"{_COMPLIANCE_ACTIONS}"
+    )
@@ -0,0 +1,89 @@
+"""
+Hazard classification shared by the detection tools
+
+Each hazard kind has a single keyword scanner and a single memoized classifier per
+process, however many tool modules detect that hazard.
+"""
+
+import bisect
+import functools
+
+from .keyword_scan import KeywordScanner
+from .keyword_tables import (
+    EMS_KEYWORDS,
+    FALL_KEYWORDS,
+    FIRE_KEYWORDS,
+    HEAT_KEYWORDS,
+    INJURY_KEYWORDS,
+    PPE_KEYWORDS,
+)
+
+SCANNERS = {
+    "ems": KeywordScanner(EMS_KEYWORDS),
+    "fire": KeywordScanner(FIRE_KEYWORDS),
+    "injury": KeywordScanner(INJURY_KEYWORDS),
+    "ppe": KeywordScanner(PPE_KEYWORDS),
+    "heat": KeywordScanner(HEAT_KEYWORDS),
+    "fall": KeywordScanner(FALL_KEYWORDS),
+}
+
+
+def scan(kind: str, description_lower: str) -> tuple[int, list[str]]:
+    """
+    Score a lowercased description against one hazard's keyword table
+
+    Args:
+        kind: Hazard kind (a key of SCANNERS)
+        description_lower: Lowercased description
+
+    Returns:
+        (total weight, matched keywords in table order)
+    """
+    return SCANNERS[kind].scan(description_lower)
+
+
+# Score thresholds (ascending) and the severity for each bucket they delimit
+SEVERITY_LEVELS: dict[str, tuple[tuple[int, ...], tuple[str, ...]]] = {
+    "ems": ((8, 15), ("MODERATE", "HIGH", "CRITICAL")),
+    "fire": ((8, 15), ("MODERATE", "HIGH", "CRITICAL")),
+    "injury": ((6, 12), ("LOW", "MODERATE", "HIGH")),
+    "ppe": ((6, 9), ("MODERATE", "HIGH", "CRITICAL")),
+    "heat": ((8, 15), ("MODERATE", "HIGH", "CRITICAL")),
+    "fall": ((8, 15), ("MODERATE", "HIGH", "CRITICAL")),
+}
+
+
+def severity_for(kind: str, score: int) -> str:
+    """
+    Bucket a positive hazard score into a severity level
+
+    Args:
+        kind: Hazard kind (a key of SEVERITY_LEVELS)
+        score: Keyword score
+
+    Returns:
+        Severity label
+    """
+    thresholds, labels = SEVERITY_LEVELS[kind]
+    return labels[bisect.bisect_right(thresholds, score)]
+
+
+@functools.lru_cache(maxsize=4096)
+def classify(kind: str, description_key: str) -> tuple[int, tuple[str, ...], str | None]:
+    """
+    Score and grade a description for one hazard kind
+
+    Pure, so repeated reports are answered from the cache.
+
+    Args:
+        kind: Hazard kind (a key of SCANNERS)
+        description_key: Lowercased, stripped description
+
+    Returns:
+        (score, matched keywords, severity), with severity None when nothing matched
+    """
+    score, detected = scan(kind, description_key)
+    if score == 0:
+        return 0, (), None
+
+    return score, tuple(detected), severity_for(kind, score)
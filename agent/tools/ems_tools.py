@@ -1,80 +1,55 @@
 from ..src.tools import tool
+from ._text import CanonText, canonical
+from .detection import classify
 from .notification_tools import mock_911_call, mock_safety_api_call
 
+# Constant response tail, starting with the line break that joins it to the report
+_EMS_ACTIONS = (
+    "\n\nImmediate Actions Required:\n"
+    "1. Do not move the worker unless immediate danger present\n"
+    "2. Assign first aid responder to stay with worker\n"
+    "3. Clear area and prepare for EMS arrival\n"
+    "4. Have worker's medical info/medications ready"
+)
+
 
 @tool(description="Detect EMS emergencies and dispatch emergency services if needed")
-def detect_ems_hazard(description: str) -> str:
+def detect_ems_hazard(description: str | CanonText) -> str:
     """
     Analyze scene for medical emergencies with severity scoring and automatic 911 dispatch
     """
-    # Define weighted keywords for better detection
-    critical_keywords = {
-        "chest pain": 10,
-        "heart attack": 10,
-        "unconscious": 10,
-        "not breathing": 10,
-        "severe bleeding": 9,
-        "allergic reaction": 8,
-        "heat stroke": 8,
-        "diabetic emergency": 7,
-        "seizure": 9,
-        "pale": 5,
-        "sweating heavily": 6,
-        "confusion": 6,
-        "laceration": 7,
-        "arterial bleed": 10,
-    }
-
-    # Calculate severity score
-    severity_score = 0
-    detected_conditions = []
-
-    desc_lower = description.lower()
-    for keyword, weight in critical_keywords.items():
-        if keyword in desc_lower:
-            severity_score += weight
-            detected_conditions.append(keyword)
+    severity_score, detected_conditions, severity = classify("ems", canonical(description))
 
-    if severity_score == 0:
+    if severity is None:
         return "No immediate medical emergency detected. Continue routine health monitoring."
 
-    # Determine severity level
-    if severity_score >= 15:
-        severity = "CRITICAL"
-    elif severity_score >= 8:
-        severity = "HIGH"
-    else:
-        severity = "MODERATE"
-
-    # Build response
-    response_parts = [f"MEDICAL EMERGENCY - Severity: {severity}"]
-    response_parts.append(f"Conditions: {', '.join(detected_conditions)}")
+    conditions = ", ".join(detected_conditions)
 
+    dispatch = ""
     if severity in ["CRITICAL", "HIGH"]:
         # Call 911
         call_response = mock_911_call(
             location="Construction Site - GPS coordinates logged",
             emergency_type="Medical Emergency",
-            description=f"Worker showing signs of: {', '.join(detected_conditions)}",
+            description=f"Worker showing signs of: {conditions}",
         )
-        response_parts.append("\n911 Dispatched")
-        response_parts.append(f"Call ID: {call_response['call_id']}")
-        response_parts.append(f"ETA: {call_response['estimated_arrival']}")
-        response_parts.append(f"Units: {', '.join(call_response['units_dispatched'])}")
 
         # Log to safety system
         api_response = mock_safety_api_call(
             incident_type="Medical Emergency",
             severity=severity,
-            data={"conditions": detected_conditions, "score": severity_score},
+            data={"conditions": list(detected_conditions), "score": severity_score},
+        )
+        dispatch = (
+            "\n\n911 Dispatched\n"
+            f"Call ID: {call_response.call_id}\n"
+            f"ETA: {call_response.estimated_arrival}\n"
+            f"Units: {', '.join(call_response.units_dispatched)}\n"
+            f"\nIncident ID: {api_response.incident_id}"
         )
-        response_parts.append(f"\nIncident ID: {api_response['incident_id']}")
-
-    # Add immediate actions
-    response_parts.append("\nImmediate Actions Required:")
-    response_parts.append("1. Do not move the worker unless immediate danger present")
-    response_parts.append("2. Assign first aid responder to stay with worker")
-    response_parts.append("3. Clear area and prepare for EMS arrival")
-    response_parts.append("4. Have worker's medical info/medications ready")
 
-    return "\n".join(response_parts)
+    return (
+        f"MEDICAL EMERGENCY - Severity: {severity}\n"
+        f"Conditions: {conditions}"
+        f"{dispatch}{_EMS_ACTIONS}"
+    )
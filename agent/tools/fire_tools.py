@@ -3,78 +3,53 @@ Fire safety detection tools
 """
 
 from ..src.tools import tool
+from ._text import CanonText, canonical
+from .detection import classify
 from .notification_tools import mock_911_call, mock_safety_api_call
 
+# Constant response tail, starting with the line break that joins it to the report
+_FIRE_ACTIONS = (
+    "\n\nImmediate Actions Required:\n"
+    "1. Evacuate immediate area\n"
+    "2. Use fire extinguisher only if safe and trained\n"
+    "3. Activate fire alarm system\n"
+    "4. Account for all personnel at muster point\n"
+    "5. Shut off utilities if safe to do so"
+)
+
 
 @tool(description="Detect fire hazards and alert fire services if needed")
-def detect_fire_hazard(description: str) -> str:
+def detect_fire_hazard(description: str | CanonText) -> str:
     """
     Analyze scene for fire hazards with risk scoring and automatic fire department notification
     """
-    risk_keywords = {
-        "fire": 10,
-        "flames": 10,
-        "smoke visible": 9,
-        "sparks": 6,
-        "combustible": 7,
-        "welding": 5,
-        "fuel": 8,
-        "oily rags": 7,
-        "electrical overload": 8,
-        "battery thermal": 9,
-        "ignition": 8,
-        "gas leak": 10,
-        "explosion": 10,
-        "smoldering": 8,
-    }
-
-    risk_score = 0
-    detected_hazards = []
-
-    desc_lower = description.lower()
-    for keyword, weight in risk_keywords.items():
-        if keyword in desc_lower:
-            risk_score += weight
-            detected_hazards.append(keyword)
+    risk_score, detected_hazards, risk_level = classify("fire", canonical(description))
 
-    if risk_score == 0:
+    if risk_level is None:
         return "No active fire hazards detected. Maintain fire prevention protocols."
 
-    # Determine risk level
-    if risk_score >= 15:
-        risk_level = "CRITICAL"
-    elif risk_score >= 8:
-        risk_level = "HIGH"
-    else:
-        risk_level = "MODERATE"
-
-    response_parts = [f"FIRE HAZARD - Risk Level: {risk_level}"]
-    response_parts.append(f"Hazards: {', '.join(detected_hazards)}")
+    hazards = ", ".join(detected_hazards)
 
+    dispatch = ""
     if risk_level in ["CRITICAL", "HIGH"]:
         # Call 911 for fire
         call_response = mock_911_call(
             location="Construction Site - Building/zone coordinates logged",
             emergency_type="Fire Emergency",
-            description=f"Fire hazard: {', '.join(detected_hazards)}",
+            description=f"Fire hazard: {hazards}",
         )
-        response_parts.append("\nFire Department Dispatched")
-        response_parts.append(f"Call ID: {call_response['call_id']}")
-        response_parts.append(f"ETA: {call_response['estimated_arrival']}")
 
         # Log to safety system
         api_response = mock_safety_api_call(
             incident_type="Fire Hazard",
             severity=risk_level,
-            data={"hazards": detected_hazards, "risk_score": risk_score},
+            data={"hazards": list(detected_hazards), "risk_score": risk_score},
+        )
+        dispatch = (
+            "\n\nFire Department Dispatched\n"
+            f"Call ID: {call_response.call_id}\n"
+            f"ETA: {call_response.estimated_arrival}\n"
+            f"\nIncident ID: {api_response.incident_id}"
         )
-        response_parts.append(f"\nIncident ID: {api_response['incident_id']}")
-
-    response_parts.append("\nImmediate Actions Required:")
-    response_parts.append("1. Evacuate immediate area")
-    response_parts.append("2. Use fire extinguisher only if safe and trained")
-    response_parts.append("3. Activate fire alarm system")
-    response_parts.append("4. Account for all personnel at muster point")
-    response_parts.append("5. Shut off utilities if safe to do so")
 
-    return "\n".join(response_parts)
+    return f"FIRE HAZARD - Risk Level: {risk_level}\nHazards: {hazards}{dispatch}{_FIRE_ACTIONS}"
@@ -0,0 +1,125 @@
+"""
+Weighted keyword tables for the hazard detection tools
+
+Keys are lowercase phrases matched as substrings of the description; values are the
+score each phrase adds. The tables are read-only and shared by every module that scans
+for the same hazard.
+"""
+
+from types import MappingProxyType
+
+# Medical emergency indicators
+EMS_KEYWORDS = MappingProxyType(
+    {
+        "chest pain": 10,
+        "heart attack": 10,
+        "unconscious": 10,
+        "not breathing": 10,
+        "severe bleeding": 9,
+        "allergic reaction": 8,
+        "heat stroke": 8,
+        "diabetic emergency": 7,
+        "seizure": 9,
+        "pale": 5,
+        "sweating heavily": 6,
+        "confusion": 6,
+        "laceration": 7,
+        "arterial bleed": 10,
+    }
+)
+
+# Fire and ignition hazards
+FIRE_KEYWORDS = MappingProxyType(
+    {
+        "fire": 10,
+        "flames": 10,
+        "smoke visible": 9,
+        "sparks": 6,
+        "combustible": 7,
+        "welding": 5,
+        "fuel": 8,
+        "oily rags": 7,
+        "electrical overload": 8,
+        "battery thermal": 9,
+        "ignition": 8,
+        "gas leak": 10,
+        "explosion": 10,
+        "smoldering": 8,
+    }
+)
+
+# Mechanical and musculoskeletal injury risks
+INJURY_KEYWORDS = MappingProxyType(
+    {
+        "caught in machinery": 10,
+        "crushing": 9,
+        "amputation": 10,
+        "eye injury": 8,
+        "flying debris": 7,
+        "laceration": 6,
+        "back strain": 5,
+        "lifting": 4,
+        "unguarded": 8,
+        "sprain": 4,
+        "slip": 5,
+        "trip": 5,
+        "fall": 7,
+    }
+)
+
+# Missing or improper PPE
+PPE_KEYWORDS = MappingProxyType(
+    {
+        "no hard hat": 9,
+        "missing hard hat": 9,
+        "without hard hat": 9,
+        "no harness": 10,
+        "no fall protection": 10,
+        "no safety glasses": 7,
+        "no hearing protection": 6,
+        "no high-vis": 8,
+        "no vest": 8,
+        "no respirator": 8,
+        "improper ppe": 6,
+    }
+)
+
+# Heat illness symptoms and conditions
+HEAT_KEYWORDS = MappingProxyType(
+    {
+        "heat stroke": 10,
+        "confused": 8,
+        "unconscious": 10,
+        "not sweating": 9,
+        "dry skin": 9,
+        "dizzy": 7,
+        "nausea": 6,
+        "temperature": 5,
+        "hot": 4,
+        "sun": 3,
+        "sweating heavily": 7,
+        "exhaustion": 7,
+        "cramping": 6,
+    }
+)
+
+# Fall-from-height hazards
+FALL_KEYWORDS = MappingProxyType(
+    {
+        "30 feet": 10,
+        "20 feet": 9,
+        "15 feet": 8,
+        "10 feet": 7,
+        "no guardrail": 10,
+        "missing guardrail": 10,
+        "unprotected edge": 9,
+        "no harness": 10,
+        "no fall protection": 10,
+        "unstable ladder": 9,
+        "scaffold": 7,
+        "roof": 7,
+        "floor opening": 9,
+        "skylight": 8,
+        "aerial lift": 6,
+    }
+)
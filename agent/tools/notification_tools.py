@@ -2,144 +2,208 @@
 Shared notification and mock service tools
 """
 
+import itertools
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any
+from typing import Any, NamedTuple
 
 from ..src.tools import tool
 
 
-def mock_911_call(location: str, emergency_type: str, description: str) -> dict[str, Any]:
+class SitePerson(NamedTuple):
+    """
+    Entry in the mock site personnel database
+    """
+
+    name: str
+    role: str
+    phone: str
+    priority: int  # 1 = management, 2 = supervisors and leads, 3 = crew
+
+
+SITE_PERSONNEL: tuple[SitePerson, ...] = (
+    SitePerson("John Smith", "Safety Manager", "+1-555-0101", 1),
+    SitePerson("Maria Garcia", "Site Supervisor", "+1-555-0102", 1),
+    SitePerson("David Chen", "Foreman - Zone A", "+1-555-0103", 2),
+    SitePerson("Sarah Johnson", "Foreman - Zone B", "+1-555-0104", 2),
+    SitePerson("Robert Williams", "Equipment Operator", "+1-555-0105", 3),
+    SitePerson("Lisa Anderson", "First Aid Responder", "+1-555-0106", 1),
+    SitePerson("Michael Brown", "Security Officer", "+1-555-0107", 2),
+    SitePerson("Jennifer Martinez", "Quality Inspector", "+1-555-0108", 3),
+    SitePerson("James Davis", "Crane Operator", "+1-555-0109", 2),
+    SitePerson("Patricia Wilson", "Electrical Lead", "+1-555-0110", 2),
+)
+
+
+class SmsDelivery(NamedTuple):
+    """
+    Delivery record for one recipient of a mock SMS broadcast
+    """
+
+    recipient: str
+    role: str
+    phone: str
+    status: str
+    delivery_time: str
+
+
+@dataclass(frozen=True, slots=True)
+class CallResponse:
+    """
+    Result of a mock 911 call
+    """
+
+    call_id: str
+    status: str
+    estimated_arrival: str
+    units_dispatched: tuple[str, ...]
+    dispatcher_notes: str
+    timestamp: str
+
+
+@dataclass(frozen=True, slots=True)
+class IncidentResponse:
+    """
+    Result of logging an incident with the mock safety API
+    """
+
+    incident_id: str
+    status: str
+    severity: str
+    notifications_sent: tuple[str, ...]
+    actions_triggered: tuple[str, ...]
+    timestamp: str
+
+
+@dataclass(frozen=True, slots=True)
+class SmsBatch:
+    """
+    Result of a mock SMS broadcast
+    """
+
+    batch_id: str
+    total_sent: int
+    urgency: str
+    message: str
+    recipients: tuple[SmsDelivery, ...]
+    failed: int
+    timestamp: str
+
+
+# Recipients per urgency, computed once; other urgencies notify management only
+_MANAGEMENT = tuple(p for p in SITE_PERSONNEL if p.priority == 1)
+_RECIPIENTS_BY_URGENCY = {
+    "CRITICAL": SITE_PERSONNEL,  # Everyone
+    "HIGH": tuple(p for p in SITE_PERSONNEL if p.priority <= 2),  # Supervisors and leads
+}
+
+
+# SMS message prefix per urgency level
+URGENCY_PREFIX = {
+    "CRITICAL": "🚨 EMERGENCY",
+    "HIGH": "⚠️ URGENT",
+    "MODERATE": "\u2139\ufe0f ALERT",  # information symbol
+    "LOW": "📢 NOTICE",
+}
+
+
+def select_recipients(urgency: str) -> tuple[SitePerson, ...]:
+    """Site personnel to notify for an urgency level"""
+    return _RECIPIENTS_BY_URGENCY.get(urgency, _MANAGEMENT)
+
+
+# Ids only change once per second, so the formatted second is reused until the clock
+# moves on; the counter keeps ids issued within the same second unique
+_id_counter = itertools.count(1)
+_id_second: tuple[int, str] = (0, "")
+
+
+def mock_id(prefix: str, now: datetime) -> str:
+    """Unique mock service id such as 911-20250115-143022-7"""
+    global _id_second
+    second = int(now.timestamp())
+    cached = _id_second
+    if second != cached[0]:
+        cached = _id_second = (second, now.strftime("%Y%m%d-%H%M%S"))
+    return f"{prefix}-{cached[1]}-{next(_id_counter)}"
+
+
+def mock_911_call(location: str, emergency_type: str, description: str) -> CallResponse:
     """Mock call to 911 emergency services"""
-    call_id = f"911-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
-
-    response = {
-        "call_id": call_id,
-        "status": "dispatched",
-        "estimated_arrival": "8-12 minutes",
-        "units_dispatched": ["Ambulance 42", "Fire Engine 7"]
+    now = datetime.now()
+    timestamp = now.isoformat()
+    call_id = mock_id("911", now)
+
+    response = CallResponse(
+        call_id=call_id,
+        status="dispatched",
+        estimated_arrival="8-12 minutes",
+        units_dispatched=("Ambulance 42", "Fire Engine 7")
         if "fire" in emergency_type.lower()
-        else ["Ambulance 42"],
-        "dispatcher_notes": f"Emergency at {location}. {description}",
-        "timestamp": datetime.now().isoformat(),
-    }
+        else ("Ambulance 42",),
+        dispatcher_notes=f"Emergency at {location}. {description}",
+        timestamp=timestamp,
+    )
 
     return response
 
 
-def mock_safety_api_call(incident_type: str, severity: str, data: dict[str, Any]) -> dict[str, Any]:
+def mock_safety_api_call(
+    incident_type: str, severity: str, data: dict[str, Any]
+) -> IncidentResponse:
     """Mock call to external safety management API"""
-    incident_id = f"INC-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
-
-    response = {
-        "incident_id": incident_id,
-        "status": "logged",
-        "severity": severity,
-        "notifications_sent": [
-            "Safety Manager",
-            "Site Supervisor",
-            "OSHA Compliance Officer" if severity == "CRITICAL" else None,
-        ],
-        "actions_triggered": [
+    now = datetime.now()
+    timestamp = now.isoformat()
+    incident_id = mock_id("INC", now)
+
+    notifications_sent = ("Safety Manager", "Site Supervisor")
+    if severity == "CRITICAL":
+        notifications_sent += ("OSHA Compliance Officer",)
+
+    response = IncidentResponse(
+        incident_id=incident_id,
+        status="logged",
+        severity=severity,
+        notifications_sent=notifications_sent,
+        actions_triggered=(
             "Work stoppage order issued" if severity == "CRITICAL" else "Safety alert issued",
             "Incident report generated",
             "Photo documentation requested",
-        ],
-        "timestamp": datetime.now().isoformat(),
-    }
+        ),
+        timestamp=timestamp,
+    )
 
     return response
 
 
 def mock_sms_notification(
     message: str, urgency: str = "HIGH", incident_type: str = "Safety Alert"
-) -> dict[str, Any]:
+) -> SmsBatch:
     """Mock SMS/text notification to all site personnel"""
-    batch_id = f"SMS-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
-
-    # Mock site personnel database
-    site_personnel = [
-        {"name": "John Smith", "role": "Safety Manager", "phone": "+1-555-0101", "priority": 1},
-        {"name": "Maria Garcia", "role": "Site Supervisor", "phone": "+1-555-0102", "priority": 1},
-        {"name": "David Chen", "role": "Foreman - Zone A", "phone": "+1-555-0103", "priority": 2},
-        {
-            "name": "Sarah Johnson",
-            "role": "Foreman - Zone B",
-            "phone": "+1-555-0104",
-            "priority": 2,
-        },
-        {
-            "name": "Robert Williams",
-            "role": "Equipment Operator",
-            "phone": "+1-555-0105",
-            "priority": 3,
-        },
-        {
-            "name": "Lisa Anderson",
-            "role": "First Aid Responder",
-            "phone": "+1-555-0106",
-            "priority": 1,
-        },
-        {
-            "name": "Michael Brown",
-            "role": "Security Officer",
-            "phone": "+1-555-0107",
-            "priority": 2,
-        },
-        {
-            "name": "Jennifer Martinez",
-            "role": "Quality Inspector",
-            "phone": "+1-555-0108",
-            "priority": 3,
-        },
-        {"name": "James Davis", "role": "Crane Operator", "phone": "+1-555-0109", "priority": 2},
-        {
-            "name": "Patricia Wilson",
-            "role": "Electrical Lead",
-            "phone": "+1-555-0110",
-            "priority": 2,
-        },
-    ]
+    now = datetime.now()
+    timestamp = now.isoformat()
+    batch_id = mock_id("SMS", now)
 
-    # Determine recipients based on urgency
-    if urgency == "CRITICAL":
-        recipients = site_personnel  # Everyone
-    elif urgency == "HIGH":
-        recipients = [p for p in site_personnel if p["priority"] <= 2]  # Supervisors and leads
-    else:
-        recipients = [p for p in site_personnel if p["priority"] == 1]  # Management only
+    recipients = select_recipients(urgency)
 
     # Format message with urgency prefix
-    urgency_prefix = {
-        "CRITICAL": "🚨 EMERGENCY",
-        "HIGH": "⚠️ URGENT",
-        "MODERATE": "\u2139\ufe0f ALERT",  # information symbol
-        "LOW": "📢 NOTICE",
-    }
-
-    formatted_message = f"{urgency_prefix.get(urgency, '📢')} {incident_type}: {message}"
+    formatted_message = f"{URGENCY_PREFIX.get(urgency, '📢')} {incident_type}: {message}"
 
     # Simulate sending messages
-    sent_messages = []
-    for person in recipients:
-        sent_messages.append(
-            {
-                "recipient": person["name"],
-                "role": person["role"],
-                "phone": person["phone"],
-                "status": "delivered",
-                "delivery_time": datetime.now().isoformat(),
-            }
-        )
-
-    response = {
-        "batch_id": batch_id,
-        "total_sent": len(sent_messages),
-        "urgency": urgency,
-        "message": formatted_message,
-        "recipients": sent_messages,
-        "failed": 0,
-        "timestamp": datetime.now().isoformat(),
-    }
+    sent_messages = tuple(
+        SmsDelivery(person.name, person.role, person.phone, "delivered", timestamp)
+        for person in recipients
+    )
+
+    response = SmsBatch(
+        batch_id=batch_id,
+        total_sent=len(sent_messages),
+        urgency=urgency,
+        message=formatted_message,
+        recipients=sent_messages,
+        failed=0,
+        timestamp=timestamp,
+    )
 
     return response
 
@@ -152,8 +216,8 @@ def send_site_alert(alert_message: str, urgency_level: str = "HIGH") -> str:
 
     result = [
         "SITE-WIDE ALERT SENT",
-        f"Batch ID: {sms_response['batch_id']}",
-        f"Total Recipients: {sms_response['total_sent']} personnel",
+        f"Batch ID: {sms_response.batch_id}",
+        f"Total Recipients: {sms_response.total_sent} personnel",
         "Delivery Status: ALL DELIVERED",
         f'\nMessage sent: "{alert_message}"',
     ]
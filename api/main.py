@@ -1,24 +1,178 @@
+import asyncio
+import functools
 import json
+import operator
+import os
 import sys
+import tempfile
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 from datetime import datetime
 from pathlib import Path
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, BinaryIO, NamedTuple
 
-from fastapi import FastAPI, HTTPException, UploadFile
+from fastapi import FastAPI, HTTPException, Request, UploadFile
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response, StreamingResponse
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from agent.safety_agents import create_runner, run_agent_system
-from pipeline.pipeline import run_video_model
+if TYPE_CHECKING:
+    from agent.src.logger import AgentTrace
+    from agent.src.runner import Runner
+
+# Worker threads for the blocking video model and agent calls
+ANALYZE_WORKERS = int(os.getenv("ANALYZE_WORKERS", "8"))
+
+# Gemini rejects requests with more than 20 MB of inline video
+MAX_UPLOAD_BYTES = int(os.getenv("MAX_UPLOAD_BYTES", str(20 * 1024 * 1024)))
+_UPLOAD_CHUNK_BYTES = 1 << 20
+# Allowance for multipart boundaries and part headers around the video in a request body
+_MULTIPART_OVERHEAD_BYTES = 64 * 1024
+
+# One agent runner per analysis thread, reused across requests
+_runners = threading.local()
+
+# Response fields of AgentTrace (minus start_ns, internal bookkeeping) and ToolCallTrace
+_TRACE_KEYS = (
+    "agent_name",
+    "start_time",
+    "end_time",
+    "duration_ms",
+    "tool_calls",
+    "iterations",
+    "handoff_to",
+    "final_output",
+)
+_TOOL_CALL_KEYS = (
+    "tool_name",
+    "arguments",
+    "result",
+    "duration_ms",
+    "timestamp",
+    "success",
+    "error",
+)
+_trace_fields = operator.attrgetter(*_TRACE_KEYS)
+_tool_call_fields = operator.attrgetter(*_TOOL_CALL_KEYS)
+
+
+class _Analysis(NamedTuple):
+    """
+    Entry points of the video model and agent system
+    """
+
+    run_video_model_from_path: Callable[[str, str], str]
+    create_runner: Callable[..., Any]
+    run_agent_system: Callable[..., str]
+    serialization: ModuleType
+
+
+@functools.lru_cache(maxsize=1)
+def _lazy() -> _Analysis:
+    """
+    Import the video model and agent system on first use
+
+    They pull in the Gemini and OpenAI SDKs, so importing them here rather than at
+    module top keeps worker startup, --reload cycles and health probes cheap.
+    """
+    from agent.safety_agents import create_runner, run_agent_system
+    from agent.src import serialization
+    from pipeline.pipeline import run_video_model_from_path
+
+    return _Analysis(run_video_model_from_path, create_runner, run_agent_system, serialization)
+
+
+class JSONResponse(Response):
+    """
+    JSON response rendered with orjson when available
+
+    Returned directly from handlers, it also skips FastAPI's jsonable_encoder pass.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return _lazy().serialization.dumps_bytes(content)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Own the analysis thread pool for the lifetime of the app"""
+    app.state.executor = ThreadPoolExecutor(
+        max_workers=ANALYZE_WORKERS, thread_name_prefix="analyze"
+    )
+    # Prewarm the heavy imports off the event loop so the first request is not slow
+    app.state.executor.submit(_lazy)
+    try:
+        yield
+    finally:
+        app.state.executor.shutdown(wait=False, cancel_futures=True)
+
 
 app = FastAPI(
     title="Construction Safety Agent API",
     description="AI-powered real-time safety monitoring",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
-# Enable CORS for React frontend
+
+class UploadSizeLimit:
+    """
+    Reject request bodies too large to hold an accepted video, before they are parsed
+
+    UploadFile.size is only known once Starlette has received and spooled the whole
+    multipart body, so the Content-Length header is checked up front, and bodies
+    sent without one (chunked) are cut off once they pass the limit.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope["method"] != "POST":
+            await self.app(scope, receive, send)
+            return
+
+        max_body_bytes = MAX_UPLOAD_BYTES + _MULTIPART_OVERHEAD_BYTES
+        content_length = Headers(scope=scope).get("content-length")
+        if content_length and content_length.isdigit():
+            if int(content_length) > max_body_bytes:
+                detail = _upload_too_large().detail
+                response = Response(
+                    json.dumps({"detail": detail}), status_code=413, media_type="application/json"
+                )
+                await response(scope, receive, send)
+                return
+            await self.app(scope, receive, send)
+            return
+
+        received = 0
+
+        async def receive_limited() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > max_body_bytes:
+                    # FastAPI re-raises HTTPExceptions from body parsing as responses
+                    raise _upload_too_large()
+            return message
+
+        await self.app(scope, receive_limited, send)
+
+
+app.add_middleware(UploadSizeLimit)
+
+# Enable CORS for React frontend (added last, so it also wraps rejected uploads)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["http://localhost:3000", "http://localhost:5173"],
@@ -49,66 +203,215 @@ async def analyze_video(file: UploadFile):
     Returns:
         JSON with event data, agent analysis, and execution trace
     """
-    # Validate file type
-    if not file.content_type or not file.content_type.startswith("video/"):
-        raise HTTPException(
-            status_code=400,
-            detail="Invalid file type. Please upload a video file.",
-        )
-
-    # Read video bytes
-    video_bytes = await file.read()
+    video_path = await _receive_video(file)
     video_id = f"api_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
 
     try:
-        # Run video analysis with Gemini
-        event_json = run_video_model(video_bytes, video_id)
-        event_data = json.loads(event_json)
-
-        # Run agent system
-        runner = create_runner(verbose=False)
-        agent_output = run_agent_system(event_json, runner)
+        loop = asyncio.get_running_loop()
+        event_data, agent_output, trace_data = await loop.run_in_executor(
+            app.state.executor, _analyze, video_path, video_id
+        )
 
-        # Get structured trace data
-        traces = runner.logger.traces
-        trace_data = [
+        return JSONResponse(
             {
-                "agent_name": t.agent_name,
-                "start_time": t.start_time,
-                "end_time": t.end_time,
-                "duration_ms": t.duration_ms,
-                "iterations": t.iterations,
-                "handoff_to": t.handoff_to,
-                "final_output": t.final_output,
-                "tool_calls": [
-                    {
-                        "tool_name": tc.tool_name,
-                        "arguments": tc.arguments,
-                        "result": tc.result,
-                        "duration_ms": tc.duration_ms,
-                        "timestamp": tc.timestamp,
-                        "success": tc.success,
-                        "error": tc.error,
-                    }
-                    for tc in t.tool_calls
-                ],
+                "status": "success",
+                "video_id": video_id,
+                "event": event_data,
+                "agent_output": agent_output,
+                "trace": trace_data,
             }
-            for t in traces
-        ]
-
-        return {
-            "status": "success",
-            "video_id": video_id,
-            "event": event_data,
-            "agent_output": agent_output,
-            "trace": trace_data,
-        }
+        )
 
     except Exception as e:
         raise HTTPException(
             status_code=500,
             detail=f"Analysis failed: {e!s}",
         ) from e
+    finally:
+        os.unlink(video_path)
+
+
+@app.post("/api/analyze/stream")
+async def analyze_video_stream(file: UploadFile, request: Request):
+    """
+    Analyze a video, streaming results as newline-delimited JSON
+
+    Emits one line per stage as soon as it is available: {"stage": "event"} after the
+    video model, one {"stage": "trace"} per finished agent, then {"stage": "result"}
+    (or {"stage": "error"}). If the client disconnects after the video model runs,
+    the agent system is skipped.
+
+    Args:
+        file: Video file (mp4, mov, avi)
+        request: Incoming request, polled for client disconnects
+
+    Returns:
+        application/x-ndjson stream
+    """
+    video_path = await _receive_video(file)
+    video_id = f"api_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+
+    loop = asyncio.get_running_loop()
+    stages: asyncio.Queue[dict[str, Any] | None] = asyncio.Queue()
+    cancelled = threading.Event()
+
+    def emit(stage: dict[str, Any] | None):
+        loop.call_soon_threadsafe(stages.put_nowait, stage)
+
+    def work():
+        try:
+            analysis = _lazy()
+            event_json = analysis.run_video_model_from_path(video_path, video_id)
+            event_data = analysis.serialization.loads(event_json)
+            emit({"stage": "event", "video_id": video_id, "event": event_data})
+            if cancelled.is_set():
+                return
+
+            runner = _thread_runner()
+            runner.logger.on_trace = lambda t: emit({"stage": "trace", "trace": _trace_data(t)})
+            try:
+                agent_output = analysis.run_agent_system(event_json, runner)
+            finally:
+                runner.logger.on_trace = None
+            emit({"stage": "result", "status": "success", "agent_output": agent_output})
+        except Exception as e:
+            emit({"stage": "error", "detail": f"Analysis failed: {e!s}"})
+        finally:
+            os.unlink(video_path)
+            emit(None)
+
+    loop.run_in_executor(app.state.executor, work)
+
+    async def lines():
+        try:
+            while (stage := await stages.get()) is not None:
+                # Imported by now: work() loads the analysis modules before emitting
+                yield _lazy().serialization.dumps_bytes(stage) + b"\n"
+                if await request.is_disconnected():
+                    break
+        finally:
+            cancelled.set()
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+async def _receive_video(file: UploadFile) -> str:
+    """
+    Validate a video upload and save it to a temporary file
+
+    Args:
+        file: Uploaded video
+
+    Returns:
+        Path of the temporary file (the caller deletes it)
+
+    Raises:
+        HTTPException: If the upload is not a video or is too large
+    """
+    # Validate file type
+    if not file.content_type or not file.content_type.startswith("video/"):
+        raise HTTPException(
+            status_code=400,
+            detail="Invalid file type. Please upload a video file.",
+        )
+
+    if file.size is not None and file.size > MAX_UPLOAD_BYTES:
+        raise _upload_too_large()
+
+    # Copy the upload to disk in chunks, off the event loop
+    return await run_in_threadpool(_save_upload, file.file)
+
+
+def _save_upload(upload: BinaryIO) -> str:
+    """
+    Copy an upload to a temporary file in fixed-size chunks (on a worker thread)
+
+    Args:
+        upload: Spooled upload file
+
+    Returns:
+        Path of the temporary file (the caller deletes it)
+
+    Raises:
+        HTTPException: If the upload exceeds MAX_UPLOAD_BYTES
+    """
+    size = 0
+    with tempfile.NamedTemporaryFile(suffix=".mp4", delete=False) as tmp:
+        try:
+            while chunk := upload.read(_UPLOAD_CHUNK_BYTES):
+                size += len(chunk)
+                if size > MAX_UPLOAD_BYTES:
+                    raise _upload_too_large()
+                tmp.write(chunk)
+        except BaseException:
+            tmp.close()
+            os.unlink(tmp.name)
+            raise
+
+    return tmp.name
+
+
+def _upload_too_large() -> HTTPException:
+    return HTTPException(
+        status_code=413,
+        detail=f"Video too large. Maximum size is {MAX_UPLOAD_BYTES // (1024 * 1024)} MB.",
+    )
+
+
+def _analyze(video_path: str, video_id: str) -> tuple[dict[str, Any], str, list[dict[str, Any]]]:
+    """
+    Run the blocking video model and agent system (on an executor thread)
+
+    Args:
+        video_path: Path of the uploaded video
+        video_id: Identifier attached to the event
+
+    Returns:
+        (event data, agent output, structured trace data)
+    """
+    run_video_model_from_path, _, run_agent_system, serialization = _lazy()
+
+    # Run video analysis with Gemini
+    event_json = run_video_model_from_path(video_path, video_id)
+    event_data = serialization.loads(event_json)
+
+    # Run agent system (with this worker thread's runner)
+    runner = _thread_runner()
+    agent_output = run_agent_system(event_json, runner)
+
+    # Get structured trace data
+    trace_data = [_trace_data(t) for t in runner.logger.traces]
+
+    return event_data, agent_output, trace_data
+
+
+def _thread_runner() -> "Runner":
+    """
+    The calling thread's agent runner, cleared of the previous request's traces
+
+    A runner's logger holds the state of one conversation at a time, so runners are
+    not shared between threads; each executor thread creates one on first use and
+    reuses it, keeping its HTTP clients, instead of building a runner per request.
+    """
+    runner = getattr(_runners, "runner", None)
+    if runner is None:
+        runner = _runners.runner = _lazy().create_runner(verbose=False)
+    runner.logger.clear()
+    return runner
+
+
+def _trace_data(trace: "AgentTrace") -> dict[str, Any]:
+    """
+    Response form of an agent trace
+
+    Fields are read with C-level attrgetters rather than dataclasses.asdict, which
+    recurses through every field and deep-copies each tool call's arguments.
+    """
+    data = dict(zip(_TRACE_KEYS, _trace_fields(trace), strict=True))
+    data["tool_calls"] = [
+        dict(zip(_TOOL_CALL_KEYS, _tool_call_fields(tc), strict=True)) for tc in trace.tool_calls
+    ]
+    return data
 
 
 @app.get("/api/health")
@@ -116,8 +419,8 @@ def health_check():
     """Detailed health check"""
     return {
         "status": "healthy",
-        "gemini": "configured" if "GEMINI_API_KEY" in str(Path.cwd()) else "check env",
-        "nvidia": "configured" if "NVIDIA_API_KEY" in str(Path.cwd()) else "check env",
+        "gemini": "configured" if os.environ.get("GEMINI_API_KEY") else "check env",
+        "nvidia": "configured" if os.environ.get("NVIDIA_API_KEY") else "check env",
     }
 
 
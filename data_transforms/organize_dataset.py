@@ -1,18 +1,91 @@
 import json
 import os
-import random
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
 TRAIN_RATIO = 0.9
 VAL_RATIO = 0.0
 TEST_RATIO = 0.1
 
+# Seed for the split shuffle; None draws fresh entropy on every run
+SPLIT_SEED = None
+
 VIDEO_DIR = ".bin/videos"
 EVENTS_DIR = ".bin/events"
 DATASET_DIR = "dataset"
 
+# Concurrent staging operations (keeps the disk queue busy on SSDs)
+MAX_STAGING_WORKERS = 32
+
+# Linux ioctl that clones a file's extents (copy-on-write); fcntl.FICLONE is 3.12+
+FICLONE = getattr(fcntl, "FICLONE", 0x40049409)
+
+
+def _reflink(src: str, dst: str):
+    """Copy-on-write clone of src to dst (btrfs, XFS, ...); raises OSError if unsupported"""
+    if fcntl is None:
+        raise OSError("reflink is not supported on this platform")
 
-def create_dataset(train_ratio=TRAIN_RATIO, val_ratio=VAL_RATIO, test_ratio=TEST_RATIO):
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        try:
+            fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+        except OSError:
+            fdst.close()
+            os.unlink(dst)
+            raise
+
+
+def _stage(src: str, dst: str):
+    """
+    Place src at dst without moving file data when the filesystem allows it
+
+    Tries a hardlink, then a copy-on-write clone, then a regular copy.
+    """
+    try:
+        os.link(src, dst)
+        return
+    except OSError:
+        pass
+
+    try:
+        _reflink(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def _files_by_stem(directory: str, suffix: str) -> dict[str, str]:
+    """Map stem -> file name for the files in directory ending with suffix"""
+    with os.scandir(directory) as entries:
+        return {e.name[: -len(suffix)]: e.name for e in entries if e.name.endswith(suffix)}
+
+
+def _jsonl(records: list[dict]) -> bytes:
+    """Encode records as compact JSON Lines"""
+    if orjson is not None:
+        lines = [orjson.dumps(record) for record in records]
+    else:
+        lines = [
+            json.dumps(record, separators=(",", ":"), ensure_ascii=False).encode()
+            for record in records
+        ]
+    return b"\n".join(lines) + b"\n"
+
+
+def create_dataset(
+    train_ratio=TRAIN_RATIO, val_ratio=VAL_RATIO, test_ratio=TEST_RATIO, seed=SPLIT_SEED
+):
     """
     Create dataset following HuggingFace conventions:
 
@@ -39,33 +112,42 @@ def create_dataset(train_ratio=TRAIN_RATIO, val_ratio=VAL_RATIO, test_ratio=TEST
 
     videos_out = os.path.join(DATASET_DIR, "videos")
     annotations_out = os.path.join(DATASET_DIR, "annotations")
-    os.makedirs(videos_out, exist_ok=True)
-    os.makedirs(annotations_out, exist_ok=True)
-
-    video_files = {f.replace(".mp4", ""): f for f in os.listdir(VIDEO_DIR) if f.endswith(".mp4")}
-    annotation_files = {
-        f.replace(".json", ""): f for f in os.listdir(EVENTS_DIR) if f.endswith(".json")
-    }
-    matched_ids = list(set(video_files.keys()) & set(annotation_files.keys()))
-
-    for video_id in matched_ids:
-        shutil.copy2(
-            os.path.join(VIDEO_DIR, video_files[video_id]),
-            os.path.join(videos_out, video_files[video_id]),
-        )
-        shutil.copy2(
-            os.path.join(EVENTS_DIR, annotation_files[video_id]),
-            os.path.join(annotations_out, annotation_files[video_id]),
-        )
-
-    random.shuffle(matched_ids)
-    train_end = int(len(matched_ids) * train_ratio)
-    val_end = train_end + int(len(matched_ids) * val_ratio)
+    # The tree was just removed, so plain mkdirs skip makedirs' existence checks
+    os.mkdir(DATASET_DIR)
+    os.mkdir(videos_out)
+    os.mkdir(annotations_out)
+
+    video_files = _files_by_stem(VIDEO_DIR, ".mp4")
+    annotation_files = _files_by_stem(EVENTS_DIR, ".json")
+    # Sorted so that a fixed seed reproduces the same splits
+    matched_ids = sorted(video_files.keys() & annotation_files.keys())
+
+    # Directory prefixes joined once rather than with os.path.join per file
+    video_src = VIDEO_DIR + os.sep
+    video_dst = videos_out + os.sep
+    annotation_src = EVENTS_DIR + os.sep
+    annotation_dst = annotations_out + os.sep
+
+    def stage_pair(video_id: str):
+        video_name = video_files[video_id]
+        annotation_name = annotation_files[video_id]
+        _stage(video_src + video_name, video_dst + video_name)
+        _stage(annotation_src + annotation_name, annotation_dst + annotation_name)
+
+    if matched_ids:
+        with ThreadPoolExecutor(max_workers=min(MAX_STAGING_WORKERS, len(matched_ids))) as ex:
+            list(ex.map(stage_pair, matched_ids))
+
+    # One C-level permutation and gather instead of a Python-level shuffle
+    ids = np.asarray(matched_ids, dtype=object)
+    ids = ids[np.random.default_rng(seed).permutation(len(ids))]
+    train_end = int(len(ids) * train_ratio)
+    val_end = train_end + int(len(ids) * val_ratio)
 
     splits = {
-        "train": matched_ids[:train_end],
-        "validation": matched_ids[train_end:val_end],
-        "test": matched_ids[val_end:],
+        "train": ids[:train_end].tolist(),
+        "validation": ids[train_end:val_end].tolist(),
+        "test": ids[val_end:].tolist(),
     }
 
     for split_name, split_ids in splits.items():
@@ -82,9 +164,8 @@ def create_dataset(train_ratio=TRAIN_RATIO, val_ratio=VAL_RATIO, test_ratio=TEST
                 }
             )
 
-        with open(os.path.join(DATASET_DIR, f"{split_name}.jsonl"), "w") as f:
-            for sample in split_data:
-                f.write(json.dumps(sample) + "\n")
+        with open(os.path.join(DATASET_DIR, f"{split_name}.jsonl"), "wb") as f:
+            f.write(_jsonl(split_data))
 
     print(f"Dataset: {DATASET_DIR}")
     print(
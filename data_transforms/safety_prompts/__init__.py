@@ -0,0 +1,77 @@
+"""
+Construction safety scenarios used as video generation prompts
+
+The scenarios live in one JSONL file per category next to this module (ems.jsonl,
+fire.jsonl, ...), one JSON object per line with the scenario's title and prompt.
+Each category is read on first access rather than compiled into the module.
+"""
+
+import functools
+import itertools
+import json
+from collections.abc import Iterator
+from pathlib import Path
+
+PROMPTS_DIR = Path(__file__).parent
+
+CATEGORIES = ("ems", "fire", "injury", "compliance", "heat", "fall")
+
+
+def iter_safety_prompts(category: str | None = None) -> Iterator[str]:
+    """
+    Stream scenario prompts from disk, one at a time
+
+    Args:
+        category: Only read scenarios of this category (one of CATEGORIES)
+
+    Yields:
+        Prompt text, in corpus order
+
+    Raises:
+        ValueError: If category is not a known category
+    """
+    if category is None:
+        for name in CATEGORIES:
+            yield from iter_safety_prompts(name)
+        return
+
+    if category not in CATEGORIES:
+        raise ValueError(f"Invalid category '{category}'. Must be one of: {list(CATEGORIES)}")
+
+    with (PROMPTS_DIR / f"{category}.jsonl").open(encoding="utf-8") as f:
+        for line in f:
+            yield json.loads(line)["prompt"]
+
+
+@functools.cache
+def get_prompts(category: str) -> tuple[str, ...]:
+    """
+    Load one category's prompts, reading only that category's file
+
+    Args:
+        category: Scenario category (one of CATEGORIES)
+
+    Returns:
+        Prompt texts of the category, cached after the first call
+
+    Raises:
+        ValueError: If category is not a known category
+    """
+    return tuple(iter_safety_prompts(category))
+
+
+@functools.cache
+def _load_prompts() -> tuple[str, ...]:
+    # A tuple, so callers cannot mutate the cached corpus
+    return tuple(itertools.chain.from_iterable(get_prompts(name) for name in CATEGORIES))
+
+
+def __getattr__(name: str):
+    # PEP 562: CONSTRUCTION_SAFETY_PROMPTS is loaded when first accessed
+    if name == "CONSTRUCTION_SAFETY_PROMPTS":
+        return _load_prompts()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def get_all_prompts() -> tuple[str, ...]:
+    return _load_prompts()
@@ -1,16 +1,18 @@
+import asyncio
 import dataclasses
 import hashlib
 import logging
 import os
+import random
 import sys
 import time
 import uuid
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections.abc import Sequence
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-from openai import OpenAI
+from openai import AsyncOpenAI
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(
@@ -50,42 +52,48 @@ class VideoResult:
     prompt: str
     video_id: uuid.UUID
     status: str = "pending"  # pending, completed, failed, error
-    video_bytes: bytes | None = None
     video_path: Path | None = None
     error_message: str | None = None
 
+    @property
+    def video_bytes(self) -> bytes | None:
+        # Read on demand: holding every finished video in memory doubled peak RSS
+        return self.video_path.read_bytes() if self.video_path is not None else None
+
 
 @dataclasses.dataclass
 class VideoDatasetGenerator:
     config: VideoConfig = dataclasses.field(default_factory=VideoConfig)
     output_dir: Path = DATASET_VIDEOS_DIR
-    max_workers: int = os.cpu_count() - 1
+    max_workers: int = os.cpu_count() - 1  # Video jobs in flight at once
     poll_interval: int = 1
-    client: OpenAI = dataclasses.field(default_factory=lambda: OpenAI())
+    max_poll_interval: float = 15  # Polling backs off from poll_interval up to this
+    client: AsyncOpenAI = dataclasses.field(default_factory=lambda: AsyncOpenAI())
 
     def __post_init__(self):
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
     def _generate_filename(self, prompt: str, video_id: str) -> str:
-        prompt_hash = hashlib.md5(prompt.encode()).hexdigest()[:8]
+        prompt_hash = hashlib.blake2b(prompt.encode(), digest_size=4).hexdigest()
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         return f"{timestamp}_{prompt_hash}_{video_id}.mp4"
 
-    def _create_video_job(self, prompt: str) -> Any:
+    async def _create_video_job(self, prompt: str) -> Any:
         params = {
             "model": self.config.model,
             "prompt": prompt,
             "seconds": str(self.config.seconds),
             "size": self.config.size,
         }
-        return self.client.videos.create(**params)
+        return await self.client.videos.create(**params)
 
-    def _poll_video(self, video_id: uuid.UUID, unique_id: uuid.UUID) -> Any:
+    async def _poll_video(self, video_id: uuid.UUID, unique_id: uuid.UUID) -> Any:
         bar_length = 40
         last_progress = 0
+        interval = self.poll_interval
 
         while True:
-            video = self.client.videos.retrieve(str(video_id))
+            video = await self.client.videos.retrieve(str(video_id))
 
             if video.status not in ("in_progress", "queued"):
                 # Clear progress bar on completion
@@ -106,27 +114,35 @@ class VideoDatasetGenerator:
                 sys.stdout.flush()
                 last_progress = progress
 
-            time.sleep(self.poll_interval)
+            # Back off while the job runs, but poll nearly finished jobs promptly
+            if progress >= 90:
+                interval = self.poll_interval
+            else:
+                interval = min(self.max_poll_interval, interval * 1.5)
+            await asyncio.sleep(interval + random.uniform(0, 0.25 * interval))
 
-    def _download_video(self, video_id: uuid.UUID, filename: str) -> Path:
+    async def _download_video(self, video_id: uuid.UUID, filename: str) -> Path:
         video_path = self.output_dir / filename
-        content = self.client.videos.download_content(str(video_id), variant="video")
-        content.write_to_file(str(video_path))
+        # Stream the body to disk in chunks instead of buffering the whole video
+        async with self.client.videos.with_streaming_response.download_content(
+            str(video_id), variant="video"
+        ) as response:
+            await response.stream_to_file(video_path)
         return video_path
 
-    def _generate_single(self, prompt: str) -> VideoResult:
+    async def _generate_single(self, prompt: str) -> VideoResult:
         unique_id = uuid.uuid4()
 
         result = VideoResult(prompt=prompt, video_id=unique_id)
 
         try:
             logger.info(f"[{unique_id}] Creating video job: {prompt[:60]}...")
-            video = self._create_video_job(prompt)
+            video = await self._create_video_job(prompt)
             api_video_id = video.id
             logger.info(f"[{unique_id}] API video ID: {api_video_id}")
 
             # Poll with progress bar
-            video = self._poll_video(api_video_id, unique_id)
+            video = await self._poll_video(api_video_id, unique_id)
 
             if video.status == "failed":
                 result.status = "failed"
@@ -138,9 +154,8 @@ class VideoDatasetGenerator:
 
             logger.info(f"[{unique_id}] Completed, downloading...")
             filename = self._generate_filename(prompt, str(api_video_id))
-            video_path = self._download_video(api_video_id, filename)
+            video_path = await self._download_video(api_video_id, filename)
             result.video_path = video_path
-            result.video_bytes = video_path.read_bytes()
             result.status = "completed"
             logger.info(f"[{unique_id}] Saved: {video_path}")
 
@@ -151,38 +166,36 @@ class VideoDatasetGenerator:
 
         return result
 
-    def _process(self, prompts: list[str]) -> list[VideoResult]:
+    async def _process(self, prompts: Sequence[str]) -> list[VideoResult]:
         results = []
+        # Jobs spend minutes waiting on the API, so they share one event loop; the
+        # semaphore caps how many are in flight at once
+        slots = asyncio.Semaphore(self.max_workers)
 
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            future_to_prompt = {
-                executor.submit(self._generate_single, prompt): prompt for prompt in prompts
-            }
-
-            completed_count = 0
-            for future in as_completed(future_to_prompt):
-                prompt = future_to_prompt[future]
+        async def generate(prompt: str) -> VideoResult:
+            async with slots:
                 try:
-                    result = future.result()
-                    results.append(result)
-                    completed_count += 1
-                    logger.info(f"Progress: {completed_count}/{len(prompts)} videos processed")
+                    return await self._generate_single(prompt)
                 except Exception as e:
                     logger.error(f"Exception for prompt '{prompt[:60]}...': {e}")
-                    results.append(
-                        VideoResult(
-                            prompt=prompt,
-                            video_id=uuid.uuid4(),
-                            status="error",
-                            error_message=str(e),
-                        )
+                    return VideoResult(
+                        prompt=prompt,
+                        video_id=uuid.uuid4(),
+                        status="error",
+                        error_message=str(e),
                     )
 
+        tasks = [asyncio.create_task(generate(prompt)) for prompt in prompts]
+
+        for completed_count, next_result in enumerate(asyncio.as_completed(tasks), start=1):
+            results.append(await next_result)
+            logger.info(f"Progress: {completed_count}/{len(prompts)} videos processed")
+
         return results
 
-    def process(self, prompts: list[str]) -> list[VideoResult]:
+    def process(self, prompts: Sequence[str]) -> list[VideoResult]:
         start_time = time.time()
-        results = self._process(prompts)
+        results = asyncio.run(self._process(prompts))
         elapsed = time.time() - start_time
         successful = sum(1 for r in results if r.status == "completed")
         failed = len(results) - successful
@@ -59,6 +59,22 @@ def run_video_model(video_bytes: bytes, video_id: str) -> str:
     return str(event.model_dump_json())
 
 
+def run_video_model_from_path(video_path: str | Path, video_id: str) -> str:
+    """
+    Run the video model on a video file
+
+    The whole file is read into memory, as Gemini takes the video inline.
+
+    Args:
+        video_path: Path of the video file
+        video_id: Identifier attached to the event
+
+    Returns:
+        Event JSON
+    """
+    return run_video_model(Path(video_path).read_bytes(), video_id)
+
+
 def pipeline(video_bytes: bytes, video_id: str = "", verbose: bool = True) -> str:
     event_description = run_video_model(video_bytes, video_id or "unknown_video")
     # Run the safety agent system